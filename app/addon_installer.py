@@ -0,0 +1,106 @@
+"""Copy the bundled BabelChat addon into the WoW AddOns folder."""
+
+from __future__ import annotations
+
+import filecmp
+import hashlib
+import shutil
+import sys
+from pathlib import Path
+
+ADDON_NAME = "BabelChat"
+MANIFEST_NAME = ".manifest"  # written into the installed addon folder
+
+# PyInstaller onefile: data extracted to _MEIPASS temp dir. Both attributes
+# are set before the app is imported, so the source is resolved once.
+if getattr(sys, "frozen", False):
+    _BUNDLE_ROOT = Path(getattr(sys, "_MEIPASS", ""))
+else:
+    _BUNDLE_ROOT = Path(__file__).resolve().parent.parent
+ADDON_SOURCE = _BUNDLE_ROOT / "addon" / ADDON_NAME
+
+
+def addon_digest(src: Path) -> str:
+    """Digest of an addon tree: relative file paths and their contents.
+
+    Contents rather than mtimes, because a frozen build re-extracts the
+    addon into _MEIPASS on every launch and its mtimes never repeat.
+    """
+    digest = hashlib.sha1()
+    for path in sorted(src.rglob("*")):
+        if path.is_file() and path.name != MANIFEST_NAME:
+            digest.update(path.relative_to(src).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def install_addon(src: Path, dest: Path) -> bool:
+    """Bring ``dest`` in line with ``src``.
+
+    Skips the copy when ``dest`` holds a manifest matching ``src``, i.e.
+    the same tree was installed before, and every file of ``src`` is still
+    there with the same size. Otherwise only changed files are
+    written and files ``src`` no longer has are removed. Returns False
+    if the installed copy was already up to date, True if it was synced.
+    Raises OSError if the copy fails.
+    """
+    digest = addon_digest(src)
+    manifest = dest / MANIFEST_NAME
+    try:
+        if manifest.read_text(encoding="ascii") == digest and _sizes_match(src, dest):
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    _sync_tree(src, dest)
+    manifest.write_text(digest, encoding="ascii")
+    return True
+
+
+def _sizes_match(src: Path, dest: Path) -> bool:
+    """Whether every file of ``src`` exists in ``dest`` with the same size.
+
+    Catches an install damaged after the manifest was written (files
+    deleted or truncated by hand, by another addon manager) without
+    reading the installed contents.
+    """
+    for path in src.rglob("*"):
+        if path.is_file() and path.name != MANIFEST_NAME:
+            target = dest / path.relative_to(src)
+            if not target.is_file() or target.stat().st_size != path.stat().st_size:
+                return False
+    return True
+
+
+def _sync_tree(src: Path, dest: Path) -> None:
+    """Make ``dest`` a copy of ``src``, rewriting only files that differ.
+
+    Files are compared with ``filecmp.cmp``: equal size and mtime count as
+    unchanged, anything else falls back to comparing contents (a frozen
+    build's freshly extracted files have new mtimes but usually the same
+    bytes). Whatever ``src`` no longer has is removed from ``dest``.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    wanted = {Path(MANIFEST_NAME)}
+    for path in src.rglob("*"):
+        rel = path.relative_to(src)
+        wanted.add(rel)
+        target = dest / rel
+        if path.is_dir():
+            if target.is_file():
+                target.unlink()
+            target.mkdir(parents=True, exist_ok=True)
+        elif not (target.is_file() and filecmp.cmp(path, target, shallow=True)):
+            if target.is_dir():
+                shutil.rmtree(target)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, target)
+
+    # Deepest paths first, so a stale directory is empty when reached
+    for path in sorted(dest.rglob("*"), reverse=True):
+        if path.relative_to(dest) not in wanted:
+            if path.is_dir() and not path.is_symlink():
+                path.rmdir()
+            else:
+                path.unlink()
@@ -23,6 +23,12 @@ CREATE TABLE IF NOT EXISTS translations (
 CREATE INDEX IF NOT EXISTS idx_created_at ON translations(created_at);
 """
 
+_INSERT_SQL = (
+    "INSERT OR REPLACE INTO translations "
+    "(source_text, source_lang, target_lang, translated, created_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
 CacheKey = tuple[str, str, str]  # (source_text, source_lang, target_lang)
 
 DEFAULT_TTL = 7 * 24 * 3600  # 7 days
@@ -35,6 +41,10 @@ class TranslationCache:
 
     Level 1: In-memory LRU OrderedDict (fast, volatile).
     Level 2: SQLite database (persistent, survives restart).
+
+    ``put(..., defer=True)`` fills level 1 right away but only queues the
+    SQLite row; ``flush()`` writes queued rows in one transaction, and
+    ``close()`` flushes whatever is left.
     """
 
     def __init__(
@@ -46,6 +56,7 @@ class TranslationCache:
         self._memory_size = memory_size
         self._ttl = ttl
         self._memory: OrderedDict[CacheKey, tuple[str, float]] = OrderedDict()
+        self._pending: list[tuple[str, str, str, str, float]] = []  # deferred SQLite rows
         self._db_path = str(db_path)
         self._lock = threading.Lock()
         self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
@@ -60,8 +71,9 @@ class TranslationCache:
 
         with self._lock:
             # Level 1: memory
-            if key in self._memory:
-                value, created_at = self._memory[key]
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
                 if time.time() - created_at > self._ttl:
                     del self._memory[key]
                 else:
@@ -94,8 +106,15 @@ class TranslationCache:
             self._memory_put(key, translated, created_at)
             return translated
 
-    def put(self, text: str, source_lang: str, target_lang: str, translated: str) -> None:
-        """Store translation in both cache levels."""
+    def put(
+        self, text: str, source_lang: str, target_lang: str, translated: str,
+        *, defer: bool = False,
+    ) -> None:
+        """Store translation in both cache levels.
+
+        With ``defer=True`` the SQLite write waits for the next flush(), so
+        the caller doesn't pay for a commit; lookups still hit level 1.
+        """
         key: CacheKey = (text, source_lang.upper(), target_lang.upper())
         now = time.time()
 
@@ -104,14 +123,26 @@ class TranslationCache:
             self._memory_put(key, translated, now)
 
             # Level 2: SQLite
-            self._conn.execute(
-                "INSERT OR REPLACE INTO translations "
-                "(source_text, source_lang, target_lang, translated, created_at) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (*key, translated, now),
-            )
+            if defer:
+                self._pending.append((*key, translated, now))
+                return
+            self._conn.execute(_INSERT_SQL, (*key, translated, now))
             self._conn.commit()
 
+    def flush(self) -> int:
+        """Write deferred puts to SQLite in one transaction. Returns row count."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        rows = self._pending
+        if not rows:
+            return 0
+        self._pending = []
+        self._conn.executemany(_INSERT_SQL, rows)
+        self._conn.commit()
+        return len(rows)
+
     def _memory_put(self, key: CacheKey, value: str, created_at: float | None = None) -> None:
         """Add to memory LRU, evicting oldest if full."""
         ts = created_at if created_at is not None else time.time()
@@ -147,6 +178,7 @@ class TranslationCache:
             }
 
     def close(self) -> None:
-        """Close database connection."""
+        """Flush deferred puts and close database connection."""
         with self._lock:
+            self._flush_locked()
             self._conn.close()
@@ -2,35 +2,43 @@
 
 import threading
 import time
-from collections import OrderedDict
+from collections import deque
 
 _DEDUP_TTL = 60.0  # seconds
 _DEDUP_MAX_SIZE = 10000  # safety cap to prevent unbounded growth
 
 
 class DeduplicationBuffer:
-    """Thread-safe dedup buffer with TTL eviction."""
+    """Thread-safe dedup buffer with TTL eviction.
+
+    Keys live in a plain dict for membership; a deque records insertion
+    order so expiry only ever looks at the oldest entry. Only the key's
+    ``hash()`` is stored, so long message texts are not kept alive for
+    the TTL; a 64-bit collision within one window is not a concern.
+    """
 
     def __init__(self, ttl: float = _DEDUP_TTL) -> None:
         self._ttl = ttl
         self._lock = threading.Lock()
-        self._recent: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._seen: dict[int, float] = {}
+        self._order: deque[tuple[int, float]] = deque()
 
     def is_duplicate(self, key: tuple[str, str]) -> bool:
         """Check if key was seen recently. If not, record it. Thread-safe."""
+        fingerprint = hash(key)
         now = time.monotonic()
         with self._lock:
+            seen = self._seen
+            order = self._order
             # Evict expired entries first so stale keys don't cause false dupes
-            while self._recent:
-                oldest_key, oldest_ts = next(iter(self._recent.items()))
-                if now - oldest_ts > self._ttl:
-                    self._recent.pop(oldest_key)
-                else:
-                    break
-            if key in self._recent:
+            expire_before = now - self._ttl
+            while order and order[0][1] < expire_before:
+                seen.pop(order.popleft()[0], None)
+            if fingerprint in seen:
                 return True
-            self._recent[key] = now
+            seen[fingerprint] = now
+            order.append((fingerprint, now))
             # Safety cap: prevent unbounded growth if eviction can't keep up
-            while len(self._recent) > _DEDUP_MAX_SIZE:
-                self._recent.popitem(last=False)
+            while len(order) > _DEDUP_MAX_SIZE:
+                seen.pop(order.popleft()[0], None)
         return False
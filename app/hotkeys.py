@@ -29,6 +29,18 @@ _VK_MAP: dict[str, int] = {
     "F1": 0x70, "F2": 0x71, "F3": 0x72, "F4": 0x73,
     "F5": 0x74, "F6": 0x75, "F7": 0x76, "F8": 0x77,
     "F9": 0x78, "F10": 0x79, "F11": 0x7A, "F12": 0x7B,
+    "F13": 0x7C, "F14": 0x7D, "F15": 0x7E, "F16": 0x7F,
+    "F17": 0x80, "F18": 0x81, "F19": 0x82, "F20": 0x83,
+    "F21": 0x84, "F22": 0x85, "F23": 0x86, "F24": 0x87,
+    "0": 0x30, "1": 0x31, "2": 0x32, "3": 0x33, "4": 0x34,
+    "5": 0x35, "6": 0x36, "7": 0x37, "8": 0x38, "9": 0x39,
+    # Remaining names as the settings HotkeyEdit records them (Qt key
+    # names without the "Key_" prefix), upper-cased for lookup
+    "SPACE": 0x20, "TAB": 0x09, "BACKSPACE": 0x08, "PAUSE": 0x13,
+    "PAGEUP": 0x21, "PAGEDOWN": 0x22, "END": 0x23, "HOME": 0x24,
+    "LEFT": 0x25, "UP": 0x26, "RIGHT": 0x27, "DOWN": 0x28,
+    "PRINT": 0x2C, "INSERT": 0x2D, "DELETE": 0x2E,
+    "EQUAL": 0xBB, "COMMA": 0xBC, "MINUS": 0xBD, "PERIOD": 0xBE,
 }
 
 
@@ -348,6 +348,11 @@ _STRINGS: dict[str, dict[str, str]] = {
         "EN": "\u2713 Installed to {dest}",
         "ES": "\u2713 Instalado en {dest}",
     },
+    "wizard.ready.addon_up_to_date": {
+        "RU": "\u2713 Уже установлен в {dest}, изменений нет",
+        "EN": "\u2713 Already up to date in {dest}",
+        "ES": "\u2713 Ya está actualizado en {dest}",
+    },
     "wizard.ready.closing": {
         "RU": (
             "Оверлей появится поверх WoW.\n"
@@ -562,6 +567,11 @@ _STRINGS: dict[str, dict[str, str]] = {
         "EN": "\u2713 Installed!",
         "ES": "\u2713 ¡Instalado!",
     },
+    "settings.wow.addon_up_to_date": {
+        "RU": "\u2713 Уже установлен, изменений нет",
+        "EN": "\u2713 Already up to date",
+        "ES": "\u2713 Ya está actualizado",
+    },
 
     "settings.lang_group": {
         "RU": "Языки",
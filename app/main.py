@@ -300,15 +300,14 @@ def main() -> int:
     pipeline_thread.message_ready.connect(overlay.add_message)
 
     # Load chat history before starting real-time feed
-    from app.parser import parse_line
+    from app.parser import parse_lines
     from app.pipeline import TranslatedMessage
     from app.watcher import ChatLogWatcher
     _history_watcher = ChatLogWatcher(pipeline_config.chatlog_path, lambda _: None)
     _history_lines = _history_watcher.read_tail(max_lines=50)
     history: list[TranslatedMessage] = []
-    for _line in _history_lines:
-        _msg = parse_line(_line)
-        if not _msg or _msg.channel not in pipeline_config.enabled_channels:
+    for _msg in parse_lines(_history_lines):
+        if _msg.channel not in pipeline_config.enabled_channels:
             continue
         # Skip NPC messages (names with spaces) in Say/Yell
         if _msg.channel in (Channel.SAY, Channel.YELL) and " " in _msg.author:
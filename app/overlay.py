@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import html
 import logging
 from collections.abc import Callable
 
-from PyQt6.QtCore import QPoint, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QColor, QCursor, QFont, QTextCharFormat, QTextCursor
+from PyQt6.QtCore import QPoint, QRunnable, Qt, QThread, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QCursor, QFont, QMouseEvent, QTextCursor
 from PyQt6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -37,14 +38,16 @@ _MIN_HEIGHT = 200            # Minimum overlay height in pixels
 _MINIMIZE_WIDTH = 180        # Width when overlay is minimized to title bar
 _MINIMIZE_HEIGHT = 32        # Height when overlay is minimized to title bar
 _EDGE_MARGIN = 8             # Pixel margin from border to trigger edge resize
+_HOVER_SLOP = 2              # Hover movement (px) below which edge hit-test is skipped
 _WOW_STATUS_INTERVAL = 2000  # WoW connection status poll interval (ms)
 _COPIED_FLASH_MS = 2000      # Duration of "Copied!" flash label (ms)
+_RENDER_BATCH_MS = 16        # Window for coalescing bursty messages into one render (ms)
 
 
 class _ResizeGrip(QLabel):
     """Draggable resize grip for bottom-right corner of overlay."""
 
-    def __init__(self, parent: QWidget) -> None:
+    def __init__(self, parent: ChatOverlay) -> None:
         super().__init__("\u2921", parent)
         self._overlay = parent
         self._drag_pos: QPoint | None = None
@@ -56,8 +59,8 @@ class _ResizeGrip(QLabel):
         self.setCursor(QCursor(Qt.CursorShape.SizeFDiagCursor))
         self.setToolTip("Resize")
 
-    def mousePressEvent(self, event: object) -> None:
-        if hasattr(event, 'button') and event.button() == Qt.MouseButton.LeftButton:
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
             self._drag_pos = event.globalPosition().toPoint()
 
     def mouseMoveEvent(self, event: object) -> None:
@@ -76,8 +79,7 @@ class _ResizeGrip(QLabel):
 
     def mouseReleaseEvent(self, event: object) -> None:
         self._drag_pos = None
-        if hasattr(self._overlay, '_save_overlay_state'):
-            self._overlay._save_overlay_state()
+        self._overlay._save_overlay_state()
 
 # WoW channel colors
 CHANNEL_COLORS: dict[Channel, str] = {
@@ -112,8 +114,26 @@ CHANNEL_PREFIXES: dict[Channel, str] = {
     Channel.INSTANCE_LEADER: "[IL]",
 }
 
+# Keep both maps dense so per-message rendering can subscript directly
+for _channel in Channel:
+    CHANNEL_COLORS.setdefault(_channel, "#FFFFFF")
+    CHANNEL_PREFIXES.setdefault(_channel, "")
+del _channel
+
 TRANSLATION_COLOR = "#FFD200"  # Gold for translated text
 
+# Prebuilt HTML fragments for chat lines — colors and prefixes are fixed per
+# channel, so a message only concatenates its timestamp, author and text.
+_HTML_LINE_START = '<span style="white-space:pre-wrap"><span style="color:#666666">'
+_HTML_ORIGINAL = '<span style="color:#888888">'
+_HTML_TRANSLATION = f'<span style="color:{TRANSLATION_COLOR}"> → '
+_CHANNEL_HTML_HEAD: dict[Channel, str] = {
+    ch: f'<span style="color:{CHANNEL_COLORS[ch]}">{CHANNEL_PREFIXES[ch]} ' for ch in Channel
+}
+_CHANNEL_HTML_TEXT: dict[Channel, str] = {
+    ch: f'<span style="color:{CHANNEL_COLORS[ch]}">' for ch in Channel
+}
+
 
 class ChannelFilterBar(QWidget):
     """Tab-like filter bar for chat channels."""
@@ -245,14 +265,28 @@ class ChatOverlay(QWidget):
         self._drag_pos: QPoint | None = None
         self._bg_opacity = config.overlay_opacity
         self._resize_edge: str | None = None
+        self._hover_pos: QPoint | None = None  # last hover position hit-tested
         self._translator: TranslatorService | None = None
         self._target_lang = "EN"
+        self._wow_checker: Callable[[], str] | None = None
         self._thread_pool = QThreadPool()
         self._messages: list[TranslatedMessage] = []
         self._max_messages = _MAX_MESSAGES
+        # Number of leading _messages shown above the session separator,
+        # None once there is no separator (no history, or all trimmed away)
+        self._history_len: int | None = None
+        # Messages waiting for the next batched render pass
+        self._pending: list[TranslatedMessage] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_RENDER_BATCH_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
         self._minimized = False
+        self._unread = 0  # messages received while minimized
+        self._chat_stale = False  # chat area missed updates while minimized
         self._restored_size: tuple[int, int] | None = None
 
+        self._refresh_tr_cache()
         self._setup_window()
         self._setup_ui()
         self.move(config.overlay_x, config.overlay_y)
@@ -260,7 +294,10 @@ class ChatOverlay(QWidget):
         self._opacity_slider.setValue(config.overlay_opacity)
         self._on_opacity_changed(config.overlay_opacity)
 
-        self.message_received.connect(self._on_message)
+        # Cross-thread deliveries only; GUI-thread callers bypass the signal
+        self.message_received.connect(
+            self._on_message, Qt.ConnectionType.QueuedConnection,
+        )
 
     def _setup_window(self) -> None:
         """Configure window flags for overlay behavior."""
@@ -281,11 +318,15 @@ class ChatOverlay(QWidget):
             _EDGE_MARGIN, _EDGE_MARGIN, _EDGE_MARGIN, _EDGE_MARGIN,
         )
         layout.setSpacing(0)
+        # Hover tracking only matters in the transparent edge margin (resize
+        # cursors). The container covers the client area and is left untracked
+        # so idle hover over the chat doesn't call into mouseMoveEvent; its own
+        # arrow cursor keeps an edge cursor from leaking into the client area.
         self.setMouseTracking(True)
 
         # Main container with WoW-dark background
         self._container = QWidget()
-        self._container.setMouseTracking(True)
+        self._container.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
         self._container.setStyleSheet(
             "background: rgba(0, 0, 0, 180); border-radius: 4px;"
         )
@@ -402,6 +443,9 @@ class ChatOverlay(QWidget):
         font = QFont("Consolas", 10)
         self._chat_area.setFont(font)
         container_layout.addWidget(self._chat_area)
+        # Reused by every render; always moved to End before inserting
+        self._chat_cursor = self._chat_area.textCursor()
+        self._chat_vbar = self._chat_area.verticalScrollBar()
 
         # ── Reply translator panel (always visible) ──
         self._reply_panel = QWidget()
@@ -519,33 +563,46 @@ class ChatOverlay(QWidget):
 
     def load_history(self, messages: list[TranslatedMessage]) -> None:
         """Load historical messages and add a separator after them."""
-        for msg in messages:
-            self._messages.append(msg)
-            self._render_message(msg)
+        self._messages.extend(messages)
+        self._append_html([self._format_message_html(msg) for msg in messages])
         if messages:
+            self._history_len = len(self._messages)
             self._render_separator()
 
+    def _refresh_tr_cache(self) -> None:
+        """Cache localized strings used on per-message and per-click paths."""
+        self._tr_translating = tr("overlay.reply.translating")
+        self._tr_error = tr("overlay.reply.error")
+        self._tr_copied = tr("overlay.reply.copied")
+        self._tr_session_start = tr("overlay.session_start")
+
+    def _separator_html(self) -> str:
+        """Build the HTML for the session separator line."""
+        label = html.escape("── " + self._tr_session_start + " ──", quote=False)
+        return f'<span style="color:#555555">{label}</span>'
+
     def _render_separator(self) -> None:
         """Render a visual separator line in the chat area."""
-        cursor = self._chat_area.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        sep_fmt = QTextCharFormat()
-        sep_fmt.setForeground(QColor("#555555"))
-        cursor.insertText("\n")
-        cursor.setCharFormat(sep_fmt)
-        cursor.insertText("── " + tr("overlay.session_start") + " ──")
-        self._chat_area.verticalScrollBar().setValue(
-            self._chat_area.verticalScrollBar().maximum()
-        )
+        self._append_html([self._separator_html()])
 
     def add_message(self, msg: TranslatedMessage) -> None:
-        """Thread-safe way to add a message (emits signal)."""
-        self.message_received.emit(msg)
+        """Thread-safe way to add a message.
+
+        On the GUI thread the message is handled directly; from any other
+        thread it goes through the queued message_received signal.
+        """
+        if QThread.currentThread() is self.thread():
+            self._on_message(msg)
+        else:
+            self.message_received.emit(msg)
 
     @pyqtSlot(object)
     def _on_message(self, msg: TranslatedMessage) -> None:
         """Handle a new translated message on the GUI thread.
 
+        New messages are buffered and rendered in batches by _flush_pending,
+        so a burst of chat costs one layout pass instead of one per message.
+
         Supports streaming updates: if msg.is_update is True, replaces the
         matching msg_id in _messages and re-renders the last message.
         """
@@ -555,6 +612,15 @@ class ChatOverlay(QWidget):
                 if self._messages[i].msg_id == msg.msg_id:
                     self._messages[i] = msg
                     break
+            if self._minimized:
+                self._chat_stale = True
+                return
+            # Original not rendered yet — it will be rendered with the translation
+            for i in range(len(self._pending) - 1, -1, -1):
+                if self._pending[i].msg_id == msg.msg_id:
+                    self._pending[i] = msg
+                    return
+            self._flush_pending()
             # Re-render: update the last line in chat area
             filter_channels = _FILTER_CHANNELS.get(self._active_filter, set(Channel))
             if msg.original.channel in filter_channels:
@@ -563,72 +629,84 @@ class ChatOverlay(QWidget):
 
         self._messages.append(msg)
         # Trim old messages to prevent unbounded growth
-        if len(self._messages) > self._max_messages:
+        trimmed = len(self._messages) > self._max_messages
+        if trimmed:
+            if self._history_len is not None:
+                self._history_len -= len(self._messages) - self._max_messages
+                if self._history_len <= 0:
+                    self._history_len = None
             self._messages = self._messages[-self._max_messages:]
+        # Chat area is hidden while minimized — keep history, render on restore
+        if self._minimized:
+            self._chat_stale = True
+            self._unread += 1
+            self._minimize_btn.setText(str(min(self._unread, 99)))
+            return
+        if trimmed:
             self._rerender_chat()
             return
-        # Only render if it passes the current filter
+        self._pending.append(msg)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self) -> None:
+        """Render all buffered messages that pass the current filter."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
         filter_channels = _FILTER_CHANNELS.get(self._active_filter, set(Channel))
-        if msg.original.channel in filter_channels:
-            self._render_message(msg)
+        self._append_html([
+            self._format_message_html(msg)
+            for msg in pending
+            if msg.original.channel in filter_channels
+        ])
 
     def _render_message(self, msg: TranslatedMessage) -> None:
         """Render a single message into the chat area."""
-        channel = msg.original.channel
+        self._append_html([self._format_message_html(msg)])
 
-        has_translation = (
-            self._translation_enabled
-            and msg.translation
-            and msg.translation.success
-            and msg.translation.translated != msg.original.text
-        )
+    def _append_html(self, fragments: list[str]) -> None:
+        """Append HTML fragments to the chat area, one line each.
 
-        cursor = self._chat_area.textCursor()
+        All insertions share one edit block, so the document is laid out
+        once per call, and the view is scrolled to the bottom once.
+        """
+        if not fragments:
+            return
+        cursor = self._chat_cursor
         cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for fragment in fragments:
+            cursor.insertBlock()
+            cursor.insertHtml(fragment)
+        cursor.endEditBlock()
+
+        # Auto-scroll to bottom
+        self._chat_vbar.setValue(self._chat_vbar.maximum())
+
+    def _format_message_html(self, msg: TranslatedMessage) -> str:
+        """Build the HTML for a single chat line."""
+        channel = msg.original.channel
 
-        # Channel color and prefix
-        color = CHANNEL_COLORS.get(channel, "#FFFFFF")
-        prefix = CHANNEL_PREFIXES.get(channel, "")
+        has_translation = self._translation_enabled and msg.has_useful_translation
 
         # Format timestamp (e.g., "2/15 21:30:45.123" → "21:30")
         ts = msg.original.timestamp
         time_part = ts.split(" ", 1)[-1] if " " in ts else ts  # "21:30:45.123"
         short_time = ":".join(time_part.split(":")[:2])  # "21:30"
 
-        # Timestamp in dim gray
-        ts_fmt = QTextCharFormat()
-        ts_fmt.setForeground(QColor("#666666"))
-        cursor.insertText("\n")
-        cursor.setCharFormat(ts_fmt)
-        cursor.insertText(f"{short_time} ")
-
-        # Channel prefix + author in channel color
-        chan_fmt = QTextCharFormat()
-        chan_fmt.setForeground(QColor(color))
-        cursor.setCharFormat(chan_fmt)
-        cursor.insertText(f"{prefix} {msg.original.author}: ")
+        author = html.escape(msg.original.author, quote=False)
+        text = html.escape(msg.original.text, quote=False)
 
+        # Timestamp in dim gray, channel prefix + author in channel color
+        line = f"{_HTML_LINE_START}{short_time} </span>{_CHANNEL_HTML_HEAD[channel]}{author}: </span>"
         if has_translation:
-            # Original text in gray (subdued)
-            orig_fmt = QTextCharFormat()
-            orig_fmt.setForeground(QColor("#888888"))
-            cursor.setCharFormat(orig_fmt)
-            cursor.insertText(msg.original.text)
-
-            # Translation in gold
-            tr_fmt = QTextCharFormat()
-            tr_fmt.setForeground(QColor(TRANSLATION_COLOR))
-            cursor.setCharFormat(tr_fmt)
-            cursor.insertText(f" → {msg.translation.translated}")
-        else:
-            # No translation — show text in channel color
-            cursor.setCharFormat(chan_fmt)
-            cursor.insertText(msg.original.text)
-
-        # Auto-scroll to bottom
-        self._chat_area.verticalScrollBar().setValue(
-            self._chat_area.verticalScrollBar().maximum()
-        )
+            # Original text in gray (subdued), translation in gold
+            translated = html.escape(msg.translation.translated, quote=False)
+            return f"{line}{_HTML_ORIGINAL}{text}</span>{_HTML_TRANSLATION}{translated}</span></span>"
+        # No translation — show text in channel color
+        return f"{line}{_CHANNEL_HTML_TEXT[channel]}{text}</span></span>"
 
     def _update_last_message(self, msg: TranslatedMessage) -> None:
         """Update the last rendered message with translation (streaming).
@@ -636,7 +714,7 @@ class ChatOverlay(QWidget):
         Removes the last line from the chat area and re-renders it with
         the translation attached.
         """
-        cursor = self._chat_area.textCursor()
+        cursor = self._chat_cursor
         cursor.movePosition(QTextCursor.MoveOperation.End)
         # Select from the last newline to the end
         cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock, QTextCursor.MoveMode.KeepAnchor)
@@ -647,12 +725,26 @@ class ChatOverlay(QWidget):
         self._render_message(msg)
 
     def _rerender_chat(self) -> None:
-        """Clear and re-render all messages matching the current filter."""
+        """Clear and re-render all messages matching the current filter.
+
+        The session separator is redrawn after the history it follows.
+        """
+        self._flush_timer.stop()
+        self._pending.clear()
         self._chat_area.clear()
         filter_channels = _FILTER_CHANNELS.get(self._active_filter, set(Channel))
-        for msg in self._messages:
-            if msg.original.channel in filter_channels:
-                self._render_message(msg)
+        fragments = [
+            self._format_message_html(msg)
+            for msg in self._messages
+            if msg.original.channel in filter_channels
+        ]
+        if self._history_len is not None:
+            shown_history = sum(
+                msg.original.channel in filter_channels
+                for msg in self._messages[:self._history_len]
+            )
+            fragments.insert(shown_history, self._separator_html())
+        self._append_html(fragments)
 
     def update_channel_filters(self, enabled: set[str]) -> None:
         """Update which filter tabs are visible based on config channel settings."""
@@ -681,6 +773,9 @@ class ChatOverlay(QWidget):
         """Toggle between full overlay and collapsed title-button."""
         self._minimized = not self._minimized
         if self._minimized:
+            # Render the batch already queued, so the unread count and the
+            # restore re-render only cover messages that arrive from now on
+            self._flush_pending()
             # Save current size, collapse
             self._restored_size = (self.width(), self.height())
             self._toolbar.hide()
@@ -705,6 +800,10 @@ class ChatOverlay(QWidget):
             self.setMinimumSize(_MIN_WIDTH, _MIN_HEIGHT)
             if self._restored_size:
                 self.resize(*self._restored_size)
+            self._unread = 0
+            if self._chat_stale:
+                self._chat_stale = False
+                self._rerender_chat()
 
     def _on_opacity_changed(self, value: int) -> None:
         self._bg_opacity = value
@@ -731,7 +830,7 @@ class ChatOverlay(QWidget):
 
     def _update_wow_status(self) -> None:
         """Update WoW connection status label."""
-        if not hasattr(self, "_wow_checker"):
+        if self._wow_checker is None:
             return
         status = self._wow_checker()
         if status == "attached":
@@ -767,7 +866,7 @@ class ChatOverlay(QWidget):
         text = self._reply_input.text().strip()
         if not text or self._translator is None:
             return
-        self._reply_output.setText(tr("overlay.reply.translating"))
+        self._reply_output.setText(self._tr_translating)
         self._reply_input.setEnabled(False)
         worker = ReplyTranslateWorker(self._translator, text, self._target_lang)
         worker.signals.finished.connect(self._on_reply_translated)
@@ -782,18 +881,18 @@ class ChatOverlay(QWidget):
             clipboard = QApplication.clipboard()
             if clipboard:
                 clipboard.setText(translated)
-            self._reply_status.setText(tr("overlay.reply.copied"))
+            self._reply_status.setText(self._tr_copied)
             QTimer.singleShot(_COPIED_FLASH_MS, lambda: self._reply_status.setText(""))
         else:
-            self._reply_output.setText(tr("overlay.reply.error"))
+            self._reply_output.setText(self._tr_error)
 
     def _copy_reply(self) -> None:
         text = self._reply_output.text()
-        if text and text != tr("overlay.reply.translating") and text != tr("overlay.reply.error"):
+        if text and text != self._tr_translating and text != self._tr_error:
             clipboard = QApplication.clipboard()
             if clipboard:
                 clipboard.setText(text)
-            self._reply_status.setText(tr("overlay.reply.copied"))
+            self._reply_status.setText(self._tr_copied)
             QTimer.singleShot(_COPIED_FLASH_MS, lambda: self._reply_status.setText(""))
 
     # -- Drag & resize support --
@@ -809,54 +908,42 @@ class ChatOverlay(QWidget):
         "l": Qt.CursorShape.SizeHorCursor,
     }
 
+    # Edge names for the 3x3 grid of (row, col) regions: 0 = near start, 2 = near end
+    _EDGE_TABLE: tuple[tuple[str | None, ...], ...] = (
+        ("tl", "t", "tr"),
+        ("l", None, "r"),
+        ("bl", "b", "br"),
+    )
+
     def _hit_edge(self, pos: QPoint) -> str | None:
         """Return resize edge name if mouse is near a border, else None."""
-        r = self.rect()
         m = _EDGE_MARGIN
-        on_left = pos.x() < m
-        on_right = pos.x() > r.width() - m
-        on_top = pos.y() < m
-        on_bottom = pos.y() > r.height() - m
-        if on_bottom and on_right:
-            return "br"
-        if on_bottom and on_left:
-            return "bl"
-        if on_top and on_right:
-            return "tr"
-        if on_top and on_left:
-            return "tl"
-        if on_bottom:
-            return "b"
-        if on_right:
-            return "r"
-        if on_left:
-            return "l"
-        if on_top:
-            return "t"
-        return None
-
-    def mousePressEvent(self, event: object) -> None:
-        if (
-            hasattr(event, 'button')
-            and event.button() == Qt.MouseButton.LeftButton  # type: ignore[union-attr]
-        ):
-            pos = event.position().toPoint()  # type: ignore[union-attr]
+        x, y = pos.x(), pos.y()
+        col = 0 if x < m else (2 if x > self.width() - m else 1)
+        row = 0 if y < m else (2 if y > self.height() - m else 1)
+        return self._EDGE_TABLE[row][col]
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            pos = event.position().toPoint()
             edge = self._hit_edge(pos)
             if edge:
                 self._resize_edge = edge
-                self._drag_pos = event.globalPosition().toPoint()  # type: ignore[union-attr]
+                self._drag_pos = event.globalPosition().toPoint()
             else:
                 self._resize_edge = None
-                self._drag_pos = event.globalPosition().toPoint() - self.pos()  # type: ignore[union-attr]
+                self._drag_pos = event.globalPosition().toPoint() - self.pos()
 
-    def mouseMoveEvent(self, event: object) -> None:
-        pos = event.position().toPoint()  # type: ignore[union-attr]
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        pos = event.position().toPoint()
 
         # Update cursor when hovering (no button pressed)
-        if not (
-            hasattr(event, 'buttons')
-            and event.buttons() & Qt.MouseButton.LeftButton  # type: ignore[union-attr]
-        ):
+        if not event.buttons() & Qt.MouseButton.LeftButton:
+            # Cursor shape only changes at the margin; skip sub-slop jitter
+            last = self._hover_pos
+            if last is not None and (pos - last).manhattanLength() <= _HOVER_SLOP:
+                return
+            self._hover_pos = pos
             edge = self._hit_edge(pos)
             if edge:
                 self.setCursor(QCursor(self._EDGE_CURSORS[edge]))
@@ -865,7 +952,7 @@ class ChatOverlay(QWidget):
             return
         if self._drag_pos is None:
             return
-        gpos = event.globalPosition().toPoint()  # type: ignore[union-attr]
+        gpos = event.globalPosition().toPoint()
         if self._resize_edge:
             self._do_resize(gpos)
         else:
@@ -894,6 +981,7 @@ class ChatOverlay(QWidget):
     def mouseReleaseEvent(self, event: object) -> None:
         self._drag_pos = None
         self._resize_edge = None
+        self._hover_pos = None
         self._save_overlay_state()
 
     # -- Settings persistence --
@@ -910,6 +998,7 @@ class ChatOverlay(QWidget):
     def apply_settings(self, config: AppConfig) -> None:
         """Apply settings from an updated AppConfig (e.g. after settings dialog)."""
         self._config = config
+        self._refresh_tr_cache()  # UI language may have changed
         self._bg_opacity = config.overlay_opacity
         self._opacity_slider.setValue(config.overlay_opacity)
         self._on_opacity_changed(config.overlay_opacity)
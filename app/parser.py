@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import re
 import time
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 
 class Channel(Enum):
@@ -24,8 +27,11 @@ class Channel(Enum):
     INSTANCE_LEADER = "Instance Leader"
 
 
+# Lookup tables below are read-only views: they are shared by the reader and
+# GUI threads and must never be mutated at runtime.
+
 # Map raw log channel names to enum (English + Russian client)
-_CHANNEL_MAP: dict[str, Channel] = {
+_CHANNEL_MAP: Mapping[str, Channel] = MappingProxyType({
     "Say": Channel.SAY,
     "Yell": Channel.YELL,
     "Party": Channel.PARTY,
@@ -50,10 +56,10 @@ _CHANNEL_MAP: dict[str, Channel] = {
     "Офицер": Channel.OFFICER,
     "Подземелье": Channel.INSTANCE,
     "Лидер подземелья": Channel.INSTANCE_LEADER,
-}
+})
 
 # Map |Hchannel:XXX| hyperlink IDs to enum (used by non-EN clients)
-_HCHANNEL_MAP: dict[str, Channel] = {
+_HCHANNEL_MAP: Mapping[str, Channel] = MappingProxyType({
     "SAY": Channel.SAY,
     "YELL": Channel.YELL,
     "PARTY": Channel.PARTY,
@@ -65,7 +71,7 @@ _HCHANNEL_MAP: dict[str, Channel] = {
     "OFFICER": Channel.OFFICER,
     "INSTANCE_CHAT": Channel.INSTANCE,
     "INSTANCE_CHAT_LEADER": Channel.INSTANCE_LEADER,
-}
+})
 
 
 @dataclass(frozen=True, slots=True)
@@ -90,144 +96,292 @@ class ChatMessage:
 # 2/15 21:30:45.123  To [Артас-Азурегос]: whisper text
 # 2/15 21:30:45.123  [Артас-Азурегос] whispers: incoming text
 
-# Common timestamp pattern shared across all regexes
-_TS = r"(?P<timestamp>\d+/\d+\s+\d+:\d+:\d+\.\d+)"
+# Every line starts with a timestamp; the formats below describe the body that
+# follows it (after the separating whitespace).
+_RE_TIMESTAMP = re.compile(r"\d++/\d++\s++\d++:\d++:\d++\.\d++")
 
-# Standard channel message: timestamp  [Channel] Author-Server: text
-# Also supports [Channel] [Author-Server]: text (RU client AddMessage format)
-_RE_CHANNEL_MSG = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"\[(?P<channel>[^\]]+)\]\s+"  # [Channel]
-    r"\[?(?P<author>[^-\s:\]]+)"  # Author (optional [ bracket)
-    r"(?:-(?P<server>[^\s:\]]+))?\]?"  # -Server (optional, optional ] bracket)
-    r":\s+"  # : separator
-    r"(?P<text>.+)$"  # message text
+# Whisper TO: timestamp  To [Author-Server]: text
+_WHISPER_TO = (
+    r"To\s++\[(?P<author>[^-\]]++)"  # To [Author
+    r"(?:-(?P<server>[^\]]++))?\]"  # -Server]
+    r":\s+"  # :
+    r"(?P<text>.+)$"  # text
+)
+
+# Whisper TO (Russian): timestamp  Кому [Author-Server]: text
+_WHISPER_TO_RU = (
+    r"Кому\s++\[(?P<author>[^-\]]++)"  # Кому [Author
+    r"(?:-(?P<server>[^\]]++))?\]"  # -Server]
+    r":\s+"  # :
+    r"(?P<text>.+)$"  # text
 )
 
+# Whisper FROM: timestamp  [Author-Server] whispers: text
+# Also handles |Hplayer:...|h[Author]|h wrapper from AddMessage
+# (RU AddMessage: "[Fury] шепчет: text", |Hplayer:...|h[Name]|h шепчет: text)
+_WHISPER_FROM = (
+    r"(?:\|Hplayer:[^|]*+\|h)?"  # optional |Hplayer:...|h
+    r"\[(?P<author>[^-\]|]++)"  # [Author (stop at - ] or |)
+    r"(?:-(?P<server>[^\]|]++))?\]"  # -Server]
+    r"(?:\|h)?\s++"  # optional |h close
+    r"(?:whispers|шепчет):\s+"  # whispers: / шепчет:
+    r"(?P<text>.+)$"  # text
+)
+
+
+def _one_of(names: Iterable[str]) -> str:
+    """Regex alternation matching exactly one of *names* (longest first)."""
+    return "|".join(map(re.escape, sorted(names, key=len, reverse=True)))
+
+
+# Channel captures list the known names, so numbered/custom channels
+# ([2. Trade], [LFG], ...) fail inside the regex engine instead of being
+# captured and then rejected by the map lookup.
+_KNOWN_CHANNEL = r"(?P<channel>" + _one_of(_CHANNEL_MAP) + ")"
+_KNOWN_HCHANNEL = r"(?P<channel>" + _one_of(_HCHANNEL_MAP) + ")"
+
 # Non-EN client format: timestamp  |Hchannel:TYPE|h[LocalizedName]|h Author-Server: text
 # Author may be wrapped in |Hplayer:...|h[Author-Server]|h from AddMessage hook
-_RE_HCHANNEL_MSG = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"\|Hchannel:(?P<channel>\w+)\|h\[[^\]]*\]\|h\s+"  # |Hchannel:TYPE|h[Name]|h
-    r"(?:\|Hplayer:[^|]*\|h)?"  # optional |Hplayer:...|h wrapper
-    r"\[?(?P<author>[^-\s:\]|]+)"  # Author (allow optional [ bracket, stop at |)
-    r"(?:-(?P<server>[^\s:\]|]+))?"  # -Server (optional)
+_HCHANNEL_TAIL = (
+    r"\|h\[[^\]]*+\]\|h\s++"  # |h[Name]|h after |Hchannel:TYPE
+    r"(?:\|Hplayer:[^|]*+\|h)?"  # optional |Hplayer:...|h wrapper
+    r"\[?(?P<author>[^-\s:\]|]++)"  # Author (allow optional [ bracket, stop at |)
+    r"(?:-(?P<server>[^\s:\]|]++))?"  # -Server (optional)
     r"\]?(?:\|h)?"  # optional ] and |h close
     r":\s+"  # : separator
     r"(?P<text>.+)$"  # message text
 )
+_HCHANNEL_MSG = r"\|Hchannel:" + _KNOWN_HCHANNEL + _HCHANNEL_TAIL
 
 # Bracket channel + player hyperlink format (RU scrollback):
 # timestamp  [Объявление рейду] |Hplayer:Name-Server:flags:TYPE:|h[Name-Server]|h: text
 # This format appears in ChatFrame scrollback for channels like Raid Warning
 # where the channel name is localized in brackets, not as |Hchannel:...|h.
-_RE_BRACKET_HPLAYER_MSG = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"\[(?P<channel>[^\]]+)\]\s+"  # [Channel Name]
-    r"\|Hplayer:[^|]*\|h"  # |Hplayer:...|h wrapper
-    r"\[(?P<author>[^-\]|]+)"  # [Author
-    r"(?:-(?P<server>[^\]|]+))?\]"  # -Server]
+_BRACKET_HPLAYER_MSG = (
+    r"\[" + _KNOWN_CHANNEL + r"\]\s++"  # [Channel Name]
+    r"\|Hplayer:[^|]*+\|h"  # |Hplayer:...|h wrapper
+    r"\[(?P<author>[^-\]|]++)"  # [Author
+    r"(?:-(?P<server>[^\]|]++))?\]"  # -Server]
     r"\|h"  # closing |h
     r":\s+"  # : separator
     r"(?P<text>.+)$"  # message text
 )
 
-# Whisper TO: timestamp  To [Author-Server]: text
-_RE_WHISPER_TO = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"To\s+\[(?P<author>[^-\]]+)"  # To [Author
-    r"(?:-(?P<server>[^\]]+))?\]"  # -Server]
-    r":\s+"  # :
-    r"(?P<text>.+)$"  # text
-)
-
-# Whisper FROM: timestamp  [Author-Server] whispers: text
-# Also handles |Hplayer:...|h[Author]|h wrapper from AddMessage
-_RE_WHISPER_FROM = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"(?:\|Hplayer:[^|]*\|h)?"  # optional |Hplayer:...|h
-    r"\[(?P<author>[^-\]|]+)"  # [Author (stop at - ] or |)
-    r"(?:-(?P<server>[^\]|]+))?\]"  # -Server]
-    r"(?:\|h)?\s+"  # optional |h close
-    r"(?:whispers|шепчет):\s+"  # whispers: / шепчет:
-    r"(?P<text>.+)$"  # text
+# Standard channel message: timestamp  [Channel] Author-Server: text
+# Also supports [Channel] [Author-Server]: text (RU client AddMessage format)
+_CHANNEL_TAIL = (
+    r"\s++"  # after [Channel]
+    r"\[?(?P<author>[^-\s:\]]++)"  # Author (optional [ bracket)
+    r"(?:-(?P<server>[^\s:\]]++))?\]?"  # -Server (optional, optional ] bracket)
+    r":\s+"  # : separator
+    r"(?P<text>.+)$"  # message text
 )
+_CHANNEL_MSG = r"\[" + _KNOWN_CHANNEL + r"\]" + _CHANNEL_TAIL
 
-# Whisper TO (Russian): timestamp  Кому [Author-Server]: text
-_RE_WHISPER_TO_RU = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"Кому\s+\[(?P<author>[^-\]]+)"  # Кому [Author
-    r"(?:-(?P<server>[^\]]+))?\]"  # -Server]
-    r":\s+"  # :
+# Whisper TO (RU AddMessage): "Вы шепчете [Name]: text"
+# Also handles |3-2(|Kj4|k) BattleNet format
+_WHISPER_TO_ADDMSG = (
+    r"(?:Вы шепчете|You whisper)\s+"  # RU/EN prefix
+    r"(?:\|Hplayer:[^|]*+\|h)?"  # optional |Hplayer:...|h
+    r"\[?(?P<author>[^-\]|:]++)"  # Author (flexible)
+    r"(?:-(?P<server>[^\]|:]++))?\]?"  # -Server (optional)
+    r"(?:\|h)?:\s+"  # optional |h, then : separator
     r"(?P<text>.+)$"  # text
 )
 
 # Say/Yell from AddMessage hook (no [Channel] prefix, uses verb):
 # Player: |Hplayer:Name-Server:flags|h[Name-Server]|h говорит: text
 # NPC:    NPC Name говорит: text  (no hyperlink, name may have spaces)
-_SAY_YELL_VERB_MAP: dict[str, Channel] = {
+_SAY_YELL_VERB_MAP: Mapping[str, Channel] = MappingProxyType({
     "says": Channel.SAY,
     "yells": Channel.YELL,
     "говорит": Channel.SAY,
     "кричит": Channel.YELL,
-}
+})
 # Player format: |Hplayer:...|h[Name-Server]|h verb: text
-_RE_SAY_YELL_PLAYER = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"\|Hplayer:[^|]*\|h"  # |Hplayer:...|h
-    r"\[(?P<author>[^-\]|]+)"  # [Author
-    r"(?:-(?P<server>[^\]|]+))?\]"  # -Server]
-    r"\|h\s+"  # |h + space
-    r"(?P<verb>says|yells|говорит|кричит):\s+"  # verb
-    r"(?P<text>.+)$"  # text
-)
-# NPC/plain format: Name verb: text (name = everything before verb)
-_RE_SAY_YELL_PLAIN = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"(?P<author>.+?)\s+"  # Author (non-greedy, may have spaces)
+_SAY_YELL_PLAYER = (
+    r"\|Hplayer:[^|]*+\|h"  # |Hplayer:...|h
+    r"\[(?P<author>[^-\]|]++)"  # [Author
+    r"(?:-(?P<server>[^\]|]++))?\]"  # -Server]
+    r"\|h\s++"  # |h + space
     r"(?P<verb>says|yells|говорит|кричит):\s+"  # verb
     r"(?P<text>.+)$"  # text
 )
+# NPC/plain format: Name verb: text (name = everything before verb, may have
+# spaces). Matches almost anything, so it is only tried after all other
+# formats, and without a regex: see _find_say_yell_plain.
+_RE_SAY_YELL_VERB = re.compile(r"(?:says|yells|говорит|кричит):")
 
-# Whisper TO (RU AddMessage): "Вы шепчете [Name]: text"
-# Also handles |3-2(|Kj4|k) BattleNet format
-_RE_WHISPER_TO_ADDMSG = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"(?:Вы шепчете|You whisper)\s+"  # RU/EN prefix
-    r"(?:\|Hplayer:[^|]*\|h)?"  # optional |Hplayer:...|h
-    r"\[?(?P<author>[^-\]|:]+)"  # Author (flexible)
-    r"(?:-(?P<server>[^\]|:]+))?\]?"  # -Server (optional)
-    r"(?:\|h)?:\s+"  # optional |h, then : separator
-    r"(?P<text>.+)$"  # text
+
+def _say_yell_text(tail: str) -> str | None:
+    r"""Text after a "verb:" as ``:\s+(.+)$`` would capture it, or None."""
+    if not tail[:1].isspace():
+        return None
+    if tail.endswith("\n"):
+        tail = tail[:-1]
+    text = tail.lstrip()
+    if text:
+        return None if "\n" in text else text
+    # Whitespace-only text: the last character is the text
+    if len(tail) < 2 or tail[-1] == "\n":
+        return None
+    return tail[-1]
+
+
+def _find_say_yell_plain(line: str, pos: int) -> tuple[str, Channel, str] | None:
+    r"""Split an NPC "Name verb: text" body starting at *pos* (the timestamp end).
+
+    Same result as matching ``\s+(.+?)\s+(says|yells|говорит|кричит):\s+(.+)$``
+    at *pos*, without the lazy author group that backtracks through every
+    offset of lines that don't match. The name starts at the first
+    non-blank character and ends at the leftmost verb preceded by whitespace
+    (so "A says: B says: hi" is from A). Returns (author, channel, raw text)
+    or None.
+    """
+    # The leading whitespace is greedy: the name starts at the first non-blank
+    body = line[pos:].lstrip()
+    if not body or len(body) == len(line) - pos:
+        return None
+    start = len(line) - len(body)
+    for m in _RE_SAY_YELL_VERB.finditer(line, start + 1):
+        verb_start = m.start()
+        if not line[verb_start - 1].isspace():
+            continue
+        author = line[start:verb_start].rstrip()
+        if "\n" in author:
+            break  # the name cannot span lines, nor can any later one
+        text = _say_yell_text(line[m.end():])
+        if text is not None:
+            return author, _SAY_YELL_VERB_MAP[m.group()[:-1]], text
+    # Last resort: verb right after the leading whitespace, with a blank
+    # name carved out of that whitespace (needs a non-newline blank inside)
+    m = _RE_SAY_YELL_VERB.match(line, start)
+    if m is None or not line[pos + 1 : start - 1].strip("\n"):
+        return None
+    text = _say_yell_text(line[m.end():])
+    if text is None:
+        return None
+    return "", _SAY_YELL_VERB_MAP[m.group()[:-1]], text
+
+
+@dataclass(frozen=True, slots=True)
+class _LineFormat:
+    """How a match of one line format becomes a ChatMessage."""
+
+    channel: Channel | None  # fixed channel, or None to look it up
+    # Bound ``get`` of the channel name / verb -> Channel map, resolved once here
+    # rather than per line
+    lookup: Callable[[str], Channel | None] | None
+    key_group: str  # group holding the channel name or verb
+    author_group: str
+    server_group: str
+    text_group: str
+    # On an unknown channel or filtered text, keep trying the later formats
+    # (``rest``) instead of rejecting the line.
+    falls_through: bool
+    rest: re.Pattern[str] | None = None
+
+
+# (name, body, fixed channel, lookup map, falls through), in match priority
+# order. Roughly most common first; formats that can match the same line keep
+# their relative order (whisper_from before bracket_hplayer before channel:
+# "[Party] whispers: hi" fits both whisper_from and channel). The outgoing
+# whisper formats start with a letter no other format starts with, so they
+# go last.
+_FORMAT_SPECS: tuple[tuple[str, str, Channel | None, Mapping[str, Channel] | None, bool], ...] = (
+    ("whisper_from", _WHISPER_FROM, Channel.WHISPER_FROM, None, False),
+    ("bracket_hplayer", _BRACKET_HPLAYER_MSG, None, _CHANNEL_MAP, True),
+    ("channel", _CHANNEL_MSG, None, _CHANNEL_MAP, False),
+    ("hchannel", _HCHANNEL_MSG, None, _HCHANNEL_MAP, False),
+    ("say_yell_player", _SAY_YELL_PLAYER, None, _SAY_YELL_VERB_MAP, True),
+    ("whisper_to", _WHISPER_TO, Channel.WHISPER_TO, None, False),
+    ("whisper_to_ru", _WHISPER_TO_RU, Channel.WHISPER_TO, None, False),
+    ("whisper_to_addmsg", _WHISPER_TO_ADDMSG, Channel.WHISPER_TO, None, False),
 )
 
-# Whisper FROM (RU AddMessage): "[Fury] шепчет: text"
-# Also: |Hplayer:...|h[Name]|h шепчет: text
-_RE_WHISPER_FROM_ADDMSG = re.compile(
-    r"^" + _TS + r"\s+"  # timestamp
-    r"(?:\|Hplayer:[^|]*\|h)?"  # optional |Hplayer:...|h
-    r"\[(?P<author>[^-\]|]+)"  # [Author
-    r"(?:-(?P<server>[^\]|]+))?\]"  # -Server]
-    r"(?:\|h)?\s+"  # optional |h
-    r"(?:whispers|шепчет):\s+"  # verb
-    r"(?P<text>.+)$"  # text
+
+def _compile_formats(specs: tuple[tuple, ...]) -> re.Pattern[str]:
+    """Compile line formats into one alternation matched right after the timestamp.
+
+    Each body is wrapped in a group named after its format so ``m.lastgroup``
+    tells which one matched; inner group names get the format name as a prefix
+    since ``re`` does not allow duplicate group names.
+    """
+    alternatives = [
+        f"(?P<{name}>" + body.replace("(?P<", f"(?P<{name}_") + ")"
+        for name, body, *_ in specs
+    ]
+    return re.compile(r"\s++(?:" + "|".join(alternatives) + ")")
+
+
+_RE_LINE_BODY = _compile_formats(_FORMAT_SPECS)
+
+# The channel formats with any channel name. A line of this shape whose
+# channel is not listed is rejected outright, not re-read as an NPC
+# "Name says: text" line.
+_RE_UNLISTED_CHANNEL = _compile_formats((
+    ("unlisted_hchannel", r"\|Hchannel:\w++" + _HCHANNEL_TAIL),
+    ("unlisted_channel", r"\[[^\]]++\]" + _CHANNEL_TAIL),
+))
+
+_LINE_FORMATS: dict[str, _LineFormat] = {
+    name: _LineFormat(
+        channel=channel,
+        lookup=lookup.get if lookup is not None else None,
+        key_group=f"{name}_verb" if lookup is _SAY_YELL_VERB_MAP else f"{name}_channel",
+        author_group=f"{name}_author",
+        server_group=f"{name}_server",
+        text_group=f"{name}_text",
+        falls_through=falls_through,
+        rest=_compile_formats(_FORMAT_SPECS[i + 1 :]) if falls_through and _FORMAT_SPECS[i + 1 :] else None,
+    )
+    for i, (name, _body, channel, lookup, falls_through) in enumerate(_FORMAT_SPECS)
+}
+
+
+# System message patterns to filter out, combined so each text is scanned
+# once: an anchored prefix match plus one search.
+_SYSTEM_PREFIXES = ("|c", "LOOT:", "You ")
+_RE_SYSTEM_PREFIX = re.compile(
+    r"\|c[0-9a-fA-F]{8}\|H"  # WoW item/spell links
+    r"|LOOT:"
+    r"|You (?:receive|create|gain|lose|die|earned)"
+)
+_SYSTEM_EN = r"(?i:has joined|has left|has come online|has gone offline)"
+_RE_SYSTEM_EN = re.compile(_SYSTEM_EN)
+_RE_SYSTEM_ANY = re.compile(
+    _SYSTEM_EN
+    + r"|присоединился|покинул|входит в игру|выходит из игры"
+    + r"|заслужил[аи]?\s+достижение"  # RU achievements
+    + r"|получает добычу|получает предмет"  # RU loot
 )
 
-# System message patterns to filter out
-_SYSTEM_PATTERNS = [
-    re.compile(r"has joined|has left|has come online|has gone offline", re.IGNORECASE),
-    re.compile(r"присоединился|покинул|входит в игру|выходит из игры"),
-    re.compile(r"^\|c[0-9a-fA-F]{8}\|H"),  # WoW item/spell links
-    re.compile(r"^LOOT:"),
-    re.compile(r"^You (receive|create|gain|lose|die|earned)"),
-    re.compile(r"заслужил[аи]?\s+достижение"),  # RU achievements
-    re.compile(r"получает добычу|получает предмет"),  # RU loot
-]
+
+def _is_system_message(
+    text: str,
+    *,
+    _match_prefix=_RE_SYSTEM_PREFIX.match,
+    _search_en=_RE_SYSTEM_EN.search,
+    _search_any=_RE_SYSTEM_ANY.search,
+) -> bool:
+    """Check if the message text matches known system message patterns."""
+    if text.startswith(_SYSTEM_PREFIXES) and _match_prefix(text):
+        return True
+    # Pure-ASCII text cannot contain the Russian phrases
+    search = _search_en if text.isascii() else _search_any
+    return search(text) is not None
 
 
-def _strip_wow_markup(text: str) -> str:
+# All WoW markup in one alternation: color codes, |r, |H...|h openers, |h closers
+_RE_WOW_MARKUP = re.compile(r"\|c[0-9a-fA-F]{8}|\|r|\|H[^|]*\|h|\|h")
+
+
+def _strip_wow_markup(text: str, *, _strip=_RE_WOW_MARKUP.sub) -> str:
     """Remove WoW hyperlink markup from text (|cXXXX|Hxxx|hText|h|r)."""
-    return re.sub(r"\|c[0-9a-fA-F]{8}|\|r|\|H[^|]*\|h|\|h", "", text)
+    # Every markup token starts with "|"; most chat text has none at all
+    if "|" not in text:
+        return text
+    return _strip("", text)
 
 
 # Full WoW hyperlink pattern: |cXXXXXXXX|Htype:data|h[Display Name]|h|r
@@ -237,176 +391,121 @@ RE_WOW_LINK = re.compile(
 )
 
 
-def _is_item_link_only(raw_text: str) -> bool:
+def _is_item_link_only(raw_text: str, *, _find_links=RE_WOW_LINK.finditer) -> bool:
     """Return True if raw text consists entirely of WoW item/spell links (no real words)."""
-    stripped = RE_WOW_LINK.sub("", raw_text).strip()
-    return len(stripped) == 0 and RE_WOW_LINK.search(raw_text) is not None
-
-
-def _clean_text(raw_text: str) -> str | None:
-    """Strip WoW markup and filter out item-link-only / system messages. Returns None to skip."""
+    if "|H" not in raw_text:  # every link contains |H
+        return False
+    # One scan over the links: bail out at the first gap holding real text
+    pos = 0
+    for m in _find_links(raw_text):
+        start = m.start()
+        if start > pos and not raw_text[pos:start].isspace():
+            return False
+        pos = m.end()
+    # pos stays 0 only if there was no link at all
+    return pos > 0 and (pos == len(raw_text) or raw_text[pos:].isspace())
+
+
+def _clean_text(
+    raw_text: str,
+    *,
+    _is_link_only=_is_item_link_only,
+    _strip_markup=_strip_wow_markup,
+    _is_system=_is_system_message,
+) -> str | None:
+    """Strip WoW markup and filter out item-link-only / system messages. Returns None to skip.
+
+    Like parse_line, the underscore keywords pre-bind the helpers.
+    """
     raw = raw_text.strip()
-    if _is_item_link_only(raw):
+    if _is_link_only(raw):
         return None
-    text = _strip_wow_markup(raw)
-    if _is_system_message(text):
+    text = _strip_markup(raw)
+    if _is_system(text):
         return None
     return text
 
 
 _RE_COLOR_CODES = re.compile(r"\|c[0-9a-fA-F]{8}|\|r")
 
-
-def parse_line(line: str) -> ChatMessage | None:
+# Recently parsed lines; the file watcher and log replays re-read the tail
+# of the log, so the same raw lines come through more than once.
+_PARSE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_line(
+    line: str,
+    *,
+    _strip_colors=_RE_COLOR_CODES.sub,
+    _match_timestamp=_RE_TIMESTAMP.match,
+    _match_body=_RE_LINE_BODY.match,
+    _find_say_yell_plain=_find_say_yell_plain,
+    _match_unlisted_channel=_RE_UNLISTED_CHANNEL.match,
+    _formats=_LINE_FORMATS,
+    _clean=_clean_text,
+    _message=ChatMessage,
+) -> ChatMessage | None:
     """Parse a single WoW Chat Log line into a ChatMessage.
 
     Supports both English and non-English (hyperlink-style) WoW clients.
     Returns None if the line is unparseable or a system message.
+
+    Results are cached per raw line (ChatMessage is frozen, so sharing is
+    safe); ``parse_line.cache_info()`` reports hit rates. The keyword-only
+    underscore arguments bind hot module-level lookups once at definition
+    time; callers never pass them.
     """
     # Strip inline color codes (|cXXXXXXXX and |r) but keep hyperlinks
     # (|Hchannel:...|h, |Hplayer:...|h).  Addon may send raw markup with
     # color-coded player names like [|cff3fc7ebName-Server|r].
-    line = _RE_COLOR_CODES.sub("", line)
-
-    # Try whisper TO (English: "To [Author]", Russian: "Кому [Author]")
-    for regex in (_RE_WHISPER_TO, _RE_WHISPER_TO_RU):
-        m = regex.match(line)
-        if m:
-            text = _clean_text(m.group("text"))
-            if text is None:
-                return None
-            return ChatMessage(
-                timestamp=m.group("timestamp"),
-                channel=Channel.WHISPER_TO,
-                author=m.group("author"),
-                server=m.group("server") or "",
-                text=text,
-            )
-
-    # Try whisper FROM (English: "whispers:", Russian: "шепчет:")
-    m = _RE_WHISPER_FROM.match(line)
-    if m:
-        text = _clean_text(m.group("text"))
-        if text is None:
-            return None
-        return ChatMessage(
-            timestamp=m.group("timestamp"),
-            channel=Channel.WHISPER_FROM,
-            author=m.group("author"),
-            server=m.group("server") or "",
-            text=text,
-        )
-
-    # Try non-EN hyperlink format: |Hchannel:TYPE|h[Name]|h Author: text
-    m = _RE_HCHANNEL_MSG.match(line)
-    if m:
-        channel_id = m.group("channel")
-        channel = _HCHANNEL_MAP.get(channel_id)
-        if channel is None:
-            return None
+    if "|" in line:
+        line = _strip_colors("", line)
 
-        text = _clean_text(m.group("text"))
-        if text is None:
-            return None
-        return ChatMessage(
-            timestamp=m.group("timestamp"),
-            channel=channel,
-            author=m.group("author"),
-            server=m.group("server") or "",
-            text=text,
-        )
-
-    # Try bracket channel + player hyperlink: [Channel] |Hplayer:...|h[Name]|h: text
-    m = _RE_BRACKET_HPLAYER_MSG.match(line)
-    if m:
-        channel_name = m.group("channel")
-        channel = _CHANNEL_MAP.get(channel_name)
+    # Chat lines start with the timestamp's month digit; reject blank lines,
+    # addon spam and fragments before any regex work.
+    if not line[:1].isdigit():
+        return None
+    ts = _match_timestamp(line)
+    if ts is None:
+        return None
+    timestamp = ts.group()
+    pos = ts.end()
+
+    # One alternation covers all bracket/hyperlink/whisper formats; the
+    # matching alternative's name says how to build the message.
+    m = _match_body(line, pos)
+    while m is not None:
+        fmt = _formats[m.lastgroup]
+        channel = fmt.channel if fmt.lookup is None else fmt.lookup(m.group(fmt.key_group))
         if channel is not None:
-            text = _clean_text(m.group("text"))
+            text = _clean(m.group(fmt.text_group))
             if text is not None:
-                return ChatMessage(
-                    timestamp=m.group("timestamp"),
+                return _message(
+                    timestamp=timestamp,
                     channel=channel,
-                    author=m.group("author"),
-                    server=m.group("server") or "",
+                    author=m.group(fmt.author_group),
+                    server=m.group(fmt.server_group) or "",
                     text=text,
                 )
-
-    # Try standard EN channel message: [Channel] Author: text
-    m = _RE_CHANNEL_MSG.match(line)
-    if m:
-        channel_name = m.group("channel")
-        channel = _CHANNEL_MAP.get(channel_name)
-        if channel is None:
-            return None  # Unknown channel (e.g., numbered channels, trade, etc.)
-
-        text = _clean_text(m.group("text"))
-        if text is None:
-            return None
-        return ChatMessage(
-            timestamp=m.group("timestamp"),
-            channel=channel,
-            author=m.group("author"),
-            server=m.group("server") or "",
-            text=text,
-        )
-
-    # Try AddMessage whisper formats (Вы шепчете / You whisper)
-    m = _RE_WHISPER_TO_ADDMSG.match(line)
-    if m:
-        text = _clean_text(m.group("text"))
-        if text is None:
-            return None
-        return ChatMessage(
-            timestamp=m.group("timestamp"),
-            channel=Channel.WHISPER_TO,
-            author=m.group("author"),
-            server=m.group("server") or "",
-            text=text,
-        )
-
-    m = _RE_WHISPER_FROM_ADDMSG.match(line)
-    if m:
-        text = _clean_text(m.group("text"))
-        if text is None:
+        if not fmt.falls_through:
             return None
-        return ChatMessage(
-            timestamp=m.group("timestamp"),
-            channel=Channel.WHISPER_FROM,
-            author=m.group("author"),
-            server=m.group("server") or "",
-            text=text,
-        )
-
-    # Try Say/Yell player format: |Hplayer:...|h[Name]|h говорит: text
-    m = _RE_SAY_YELL_PLAYER.match(line)
-    if m:
-        verb = m.group("verb").lower()
-        channel = _SAY_YELL_VERB_MAP.get(verb)
-        if channel:
-            text = _clean_text(m.group("text"))
-            if text is not None:
-                return ChatMessage(
-                    timestamp=m.group("timestamp"),
-                    channel=channel,
-                    author=m.group("author"),
-                    server=m.group("server") or "",
-                    text=text,
-                )
+        m = fmt.rest.match(line, pos) if fmt.rest is not None else None
 
     # Try Say/Yell plain format: NPC Name говорит: text
-    m = _RE_SAY_YELL_PLAIN.match(line)
-    if m:
-        verb = m.group("verb").lower()
-        channel = _SAY_YELL_VERB_MAP.get(verb)
-        if channel:
-            text = _clean_text(m.group("text"))
+    if "says:" in line or "yells:" in line or "говорит:" in line or "кричит:" in line:
+        if _match_unlisted_channel(line, pos):
+            return None  # Unknown channel (e.g., numbered channels, trade, etc.)
+        found = _find_say_yell_plain(line, pos)
+        if found is not None:
+            author, channel, raw_text = found
+            text = _clean(raw_text)
             if text is not None:
                 # Author may have spaces (NPC names); no server
-                return ChatMessage(
-                    timestamp=m.group("timestamp"),
+                return _message(
+                    timestamp=timestamp,
                     channel=channel,
-                    author=m.group("author").strip(),
+                    author=author,
                     server="",
                     text=text,
                 )
@@ -414,13 +513,14 @@ def parse_line(line: str) -> ChatMessage | None:
     return None
 
 
-def _is_system_message(text: str) -> bool:
-    """Check if the message text matches known system message patterns."""
-    return any(p.search(text) for p in _SYSTEM_PATTERNS)
+def parse_lines(lines: Iterable[str]) -> list[ChatMessage]:
+    """Parse a batch of chat log lines (e.g. history), dropping unparseable ones."""
+    parse = parse_line
+    return [msg for line in lines if (msg := parse(line)) is not None]
 
 
 # Map addon CHAT_MSG_* event channel names to Channel enum
-_ADDON_CHANNEL_MAP: dict[str, Channel] = {
+_ADDON_CHANNEL_MAP: Mapping[str, Channel] = MappingProxyType({
     "SAY": Channel.SAY,
     "YELL": Channel.YELL,
     "PARTY": Channel.PARTY,
@@ -434,7 +534,26 @@ _ADDON_CHANNEL_MAP: dict[str, Channel] = {
     "WHISPER_INFORM": Channel.WHISPER_TO,
     "INSTANCE_CHAT": Channel.INSTANCE,
     "INSTANCE_CHAT_LEADER": Channel.INSTANCE_LEADER,
-}
+})
+
+
+# Addon lines carry no timestamp of their own; they get the local time,
+# formatted at most once per wall-clock second: (epoch second, formatted).
+# Replaced as one tuple, so a concurrent reader never pairs a second with
+# another second's string.
+_addon_ts: tuple[int, str] = (-1, "")
+
+
+def _addon_timestamp() -> str:
+    """Return the current local time in chat log format (cached per second)."""
+    global _addon_ts
+    now = int(time.time())
+    second, formatted = _addon_ts
+    if now != second:
+        t = time.localtime(now)
+        formatted = f"{t.tm_mon}/{t.tm_mday} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.000"
+        _addon_ts = (now, formatted)
+    return formatted
 
 
 def parse_addon_line(line: str) -> tuple[ChatMessage | None, int]:
@@ -447,21 +566,29 @@ def parse_addon_line(line: str) -> tuple[ChatMessage | None, int]:
 
     Returns (ChatMessage or None, sequence_number).
     """
-    parts = line.split("|", 4)
-    if len(parts) < 4:
+    # Peel fields off with partition: no intermediate list, and a missing
+    # separator short-circuits immediately.
+    seq_str, sep, rest = line.partition("|")
+    if not sep:
         return None, 0
+    field1, sep, rest = rest.partition("|")
+    if not sep:
+        return None, 0
+    field2, sep, rest = rest.partition("|")
+    if not sep:
+        return None, 0
+    field3, sep, field4 = rest.partition("|")
 
-    seq_str = parts[0]
     # v2.1 format: skip KIND field, use EVENT as channel
-    if parts[1] in ("RAW", "DICT") and len(parts) >= 5:
-        channel_str = parts[2]
-        author_full = parts[3]
-        text = parts[4]
+    if sep and field1 in ("RAW", "DICT"):
+        channel_str = field2
+        author_full = field3
+        text = field4
     else:
-        # Legacy format
-        channel_str = parts[1]
-        author_full = parts[2]
-        text = parts[3] if len(parts) > 3 else ""
+        # Legacy format (text ends at a fourth separator, if any)
+        channel_str = field1
+        author_full = field2
+        text = field3
 
     try:
         seq = int(seq_str)
@@ -482,11 +609,8 @@ def parse_addon_line(line: str) -> tuple[ChatMessage | None, int]:
     if text is None:
         return None, seq
 
-    t = time.localtime()
-    timestamp = f"{t.tm_mon}/{t.tm_mday} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.000"
-
     return ChatMessage(
-        timestamp=timestamp,
+        timestamp=_addon_timestamp(),
         channel=channel,
         author=author,
         server=server,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import itertools
 import logging
+import sqlite3
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -14,9 +16,8 @@ from app.cache import TranslationCache
 from app.dedup import DeduplicationBuffer
 from app.detector import ChatLanguageDetector
 from app.glossary import expand_wow_terms
-from app.parser import Channel, ChatMessage, parse_line
-from app.phrasebook import lookup as phrasebook_lookup
-from app.phrasebook import lookup_abbreviation as phrasebook_abbrev
+from app.parser import Channel, ChatMessage, parse_line, parse_lines
+from app.phrasebook import PhrasebookSession
 from app.slang import expand_slang
 from app.text_utils import (
     clean_message_text,
@@ -26,18 +27,14 @@ from app.text_utils import (
 from app.translator import TranslationResult, TranslatorService
 from app.watcher import ChatLogWatcher
 
-# Memory reader is optional — requires pymem and admin privileges
-try:
-    from app.memory_reader import MemoryChatWatcher
-    HAS_MEMORY_READER = True
-except ImportError:
-    HAS_MEMORY_READER = False
-
 logger = logging.getLogger(__name__)
 
 # Max characters to show in log preview messages
 _LOG_PREVIEW = 60
 
+# How often deferred cache writes are committed to SQLite
+_CACHE_FLUSH_INTERVAL = 1.0  # seconds
+
 # Context string sent to DeepL for domain-aware translation
 _DEEPL_CONTEXT = "World of Warcraft multiplayer game raid group chat"
 
@@ -84,6 +81,14 @@ class TranslatedMessage:
     source_lang: str = ""
     msg_id: int = 0       # unique ID for streaming updates
     is_update: bool = False  # True when this replaces a previous msg_id
+    # Successful translation that differs from the original (computed once)
+    has_useful_translation: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        t = self.translation
+        self.has_useful_translation = (
+            t is not None and t.success and t.translated != self.original.text
+        )
 
 
 @dataclass
@@ -107,6 +112,29 @@ class PipelineConfig:
     use_memory_reader: bool = True  # Reads addon buffer from WoW process memory
 
 
+@dataclass(frozen=True, slots=True)
+class _ConfigSnapshot:
+    """A PipelineConfig plus the per-message lookups derived from it.
+
+    update_config() swaps the whole snapshot in one assignment, so a message
+    handled meanwhile reads either the old or the new settings, never a mix.
+    """
+
+    config: PipelineConfig
+    enabled_channels: frozenset[Channel]
+    own_deepl: str  # DeepL code of own_language, "" if DeepL has none
+    phrasebook: PhrasebookSession  # bound to config.target_lang
+
+    @classmethod
+    def of(cls, config: PipelineConfig) -> _ConfigSnapshot:
+        return cls(
+            config,
+            frozenset(config.enabled_channels),
+            _LINGUA_TO_DEEPL.get(config.own_language, ""),
+            PhrasebookSession(config.target_lang),
+        )
+
+
 class TranslationPipeline:
     """Orchestrates the full translation pipeline.
 
@@ -119,11 +147,15 @@ class TranslationPipeline:
         config: PipelineConfig,
         on_message: Callable[[TranslatedMessage], None],
     ) -> None:
-        self._config = config
+        self._snapshot = _ConfigSnapshot.of(config)
         self._on_message = on_message
 
         self._cache = TranslationCache(db_path=config.db_path)
         self._cache.cleanup()  # remove expired entries on startup
+        # Cache puts are deferred off the message thread and committed in
+        # batches by _cache_flush_loop (started in start())
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
         self._detector = ChatLanguageDetector(own_language=config.own_language)
         self._translator = TranslatorService(api_key=config.deepl_api_key)
         self._watcher = ChatLogWatcher(config.chatlog_path, self._on_new_line)
@@ -136,19 +168,25 @@ class TranslationPipeline:
         # itertools.count is thread-safe in CPython (atomic C-level next())
         self._msg_id_counter = itertools.count(1)
 
-        # Memory reader (optional, real-time delivery)
+        # Memory reader (optional, real-time delivery). Requires pymem and
+        # admin privileges; imported only when enabled.
         self._memory_watcher = None
-        if config.use_memory_reader and HAS_MEMORY_READER:
-            self._memory_watcher = MemoryChatWatcher(self._on_new_line)
-            logger.info("Memory reader available, will try real-time mode")
+        if config.use_memory_reader:
+            try:
+                from app.memory_reader import MemoryChatWatcher
+            except ImportError:
+                logger.info("Memory reader unavailable, using file watcher")
+            else:
+                self._memory_watcher = MemoryChatWatcher(self._on_new_line)
+                logger.info("Memory reader available, will try real-time mode")
 
     @property
     def translation_enabled(self) -> bool:
-        return self._config.translation_enabled
+        return self._snapshot.config.translation_enabled
 
     @translation_enabled.setter
     def translation_enabled(self, value: bool) -> None:
-        self._config.translation_enabled = value
+        self._snapshot.config.translation_enabled = value
         logger.info("Translation %s", "enabled" if value else "disabled")
 
     def update_config(self, config: PipelineConfig) -> None:
@@ -157,9 +195,10 @@ class TranslationPipeline:
         Updates detector language, target language, enabled channels, etc.
         Called from the main thread when user saves settings.
         """
-        old_own = self._config.own_language
-        old_target = self._config.target_lang
-        self._config = config
+        old = self._snapshot.config
+        old_own = old.own_language
+        old_target = old.target_lang
+        self._snapshot = _ConfigSnapshot.of(config)
         self._detector.own_language = config.own_language
         if old_own != config.own_language:
             logger.info("Own language changed: %s -> %s", old_own, config.own_language)
@@ -169,15 +208,12 @@ class TranslationPipeline:
     def load_history(self, max_lines: int = 50) -> list[TranslatedMessage]:
         """Read last N lines from the log and parse them (no translation)."""
         lines = self._watcher.read_tail(max_lines)
-        messages = []
-        for line in lines:
-            msg = parse_line(line)
-            if msg is None:
-                continue
-            if msg.channel not in self._config.enabled_channels:
-                continue
-            messages.append(TranslatedMessage(original=msg, translation=None))
-        return messages
+        enabled = self._snapshot.enabled_channels
+        return [
+            TranslatedMessage(original=msg, translation=None)
+            for msg in parse_lines(lines)
+            if msg.channel in enabled
+        ]
 
     def start(self) -> None:
         """Start watching the chat log and translating.
@@ -187,6 +223,10 @@ class TranslationPipeline:
         Running both causes duplicate messages (WoW buffers chatlog writes
         for minutes, then flushes a huge batch that bypasses dedup TTL).
         """
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(target=self._cache_flush_loop, daemon=True)
+        self._flush_thread.start()
+
         # Try memory reader first (real-time, preferred)
         if self._memory_watcher:
             try:
@@ -205,9 +245,24 @@ class TranslationPipeline:
         if self._memory_watcher:
             self._memory_watcher.stop()
         self._watcher.stop()  # safe even if not started
-        self._cache.close()
+        self._flush_stop.set()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=5)
+        self._cache.close()  # commits any remaining deferred puts
         logger.info("Pipeline stopped")
 
+    def _cache_flush_loop(self) -> None:
+        """Commit deferred cache puts every _CACHE_FLUSH_INTERVAL seconds."""
+        while not self._flush_stop.wait(_CACHE_FLUSH_INTERVAL):
+            try:
+                self._cache.flush()
+            except sqlite3.Error as e:
+                logger.warning("Cache flush failed: %s", e)
+
+    def _emit_untranslated(self, msg: ChatMessage) -> None:
+        """Show a message in the overlay without a translation."""
+        self._on_message(TranslatedMessage(original=msg, translation=None))
+
     def _on_new_line(
         self, line: str, *,
         dict_translated: bool = False,
@@ -221,20 +276,26 @@ class TranslationPipeline:
                 this message inline in chat.
         """
         logger.debug("New line: %s", line[:120])
+        # Per-message info logs slice their arguments; skip that work
+        # entirely when INFO is off (checked once per line)
+        log_info = logger.isEnabledFor(logging.INFO)
         msg = parse_line(line)
         if msg is None:
-            logger.info("Parse returned None for: %s", line[:150])
+            if log_info:
+                logger.info("Parse returned None for: %s", line[:150])
             return
 
-        logger.info(
-            "Parsed: [%s] %s: %s (dict=%s)",
-            msg.channel.value, msg.author, msg.text[:_LOG_PREVIEW], dict_translated,
-        )
+        if log_info:
+            logger.info(
+                "Parsed: [%s] %s: %s (dict=%s)",
+                msg.channel.value, msg.author, msg.text[:_LOG_PREVIEW], dict_translated,
+            )
 
         # Snapshot config for consistent reads within this method.
         # Reference assignment is atomic under CPython's GIL, so this is safe
-        # even when update_config() replaces self._config from another thread.
-        cfg = self._config
+        # even when update_config() replaces self._snapshot from another thread.
+        snapshot = self._snapshot
+        cfg = snapshot.config
 
         # Deduplicate: both memory reader and file watcher may deliver same message
         if self._dedup.is_duplicate((msg.author, msg.text)):
@@ -242,7 +303,7 @@ class TranslationPipeline:
             return
 
         # Filter by channel
-        if msg.channel not in cfg.enabled_channels:
+        if msg.channel not in snapshot.enabled_channels:
             logger.debug("Channel %s not enabled", msg.channel)
             return
 
@@ -261,19 +322,20 @@ class TranslationPipeline:
             and own_char
             and msg.author == own_char
         ):
-            logger.info("Skip own message (no translate): %s", msg.text[:_LOG_PREVIEW])
-            self._on_message(TranslatedMessage(original=msg, translation=None))
+            if log_info:
+                logger.info("Skip own message (no translate): %s", msg.text[:_LOG_PREVIEW])
+            self._emit_untranslated(msg)
             return
 
         # Translation disabled — still emit message without translation
         if not cfg.translation_enabled:
-            self._on_message(TranslatedMessage(original=msg, translation=None))
+            self._emit_untranslated(msg)
             return
 
         # Dictionary-translated by addon — ignore addon dict, use DeepL instead.
         # Addon dict adds inline translations like "speed(Скорость)" which are
         # redundant when companion app does full DeepL translation.
-        if dict_translated:
+        if dict_translated and log_info:
             logger.info("Dict message ignored, using DeepL: %s", msg.text[:_LOG_PREVIEW])
 
         # Clean and validate text
@@ -282,10 +344,11 @@ class TranslationPipeline:
             return
 
         target_lang = cfg.target_lang
+        phrasebook = snapshot.phrasebook
 
         # Check abbreviations before language detection (catches short gg/ty/bb
         # that would fail MIN_TEXT_LENGTH in the detector)
-        abbrev_hit = phrasebook_abbrev(cleaned_text, target_lang)
+        abbrev_hit = phrasebook.lookup_abbreviation(cleaned_text)
         if abbrev_hit is not None:
             result = TranslationResult(
                 original=cleaned_text, translated=abbrev_hit,
@@ -301,31 +364,34 @@ class TranslationPipeline:
         detected = self._detector.detect(cleaned_text)
         if detected is None:
             # Own language or skip-phrase — emit without translation
-            logger.info("Skip (own lang / skip-phrase): %r", cleaned_text[:_LOG_PREVIEW])
-            self._on_message(TranslatedMessage(original=msg, translation=None))
+            if log_info:
+                logger.info("Skip (own lang / skip-phrase): %r", cleaned_text[:_LOG_PREVIEW])
+            self._emit_untranslated(msg)
             return
 
         # UNKNOWN = lingua couldn't determine, let DeepL auto-detect
         if detected == ChatLanguageDetector.UNKNOWN:
             source_lang = ""
-            logger.info("Translating (auto-detect)→%s: %r", target_lang, cleaned_text[:_LOG_PREVIEW])
+            if log_info:
+                logger.info("Translating (auto-detect)→%s: %r", target_lang, cleaned_text[:_LOG_PREVIEW])
         else:
             source_lang = _LINGUA_TO_DEEPL.get(detected, "")
             if not source_lang:
                 # Lingua detected a language not in DeepL map — let DeepL
                 # auto-detect instead of skipping.
-                logger.info(
-                    "Translating (auto-detect, lingua=%s)→%s: %r",
-                    detected, target_lang, cleaned_text[:_LOG_PREVIEW],
-                )
-            else:
+                if log_info:
+                    logger.info(
+                        "Translating (auto-detect, lingua=%s)→%s: %r",
+                        detected, target_lang, cleaned_text[:_LOG_PREVIEW],
+                    )
+            elif log_info:
                 logger.info(
                     "Translating %s→%s: %r",
                     source_lang, target_lang, cleaned_text[:_LOG_PREVIEW],
                 )
 
-        # Check phrasebook (instant, no API call)
-        phrasebook_hit = phrasebook_lookup(cleaned_text, source_lang, target_lang)
+        # Check phrasebook (instant, no API call); abbreviations already missed
+        phrasebook_hit = phrasebook.lookup_phrase(cleaned_text, source_lang)
         if phrasebook_hit is not None:
             result = TranslationResult(
                 original=cleaned_text, translated=phrasebook_hit,
@@ -356,13 +422,18 @@ class TranslationPipeline:
         # Expand gaming slang to plain English so DeepL can understand
         expanded = expand_slang(text_to_translate)
         if expanded != text_to_translate:
-            logger.info("Slang expanded: %r → %r", text_to_translate[:_LOG_PREVIEW], expanded[:_LOG_PREVIEW])
+            if log_info:
+                logger.info("Slang expanded: %r → %r", text_to_translate[:_LOG_PREVIEW], expanded[:_LOG_PREVIEW])
             text_to_translate = expanded
 
         # Expand WoW-specific terms (context-gated: 2+ gaming terms required)
         wow_expanded = expand_wow_terms(text_to_translate)
         if wow_expanded != text_to_translate:
-            logger.info("WoW terms expanded: %r → %r", text_to_translate[:_LOG_PREVIEW], wow_expanded[:_LOG_PREVIEW])
+            if log_info:
+                logger.info(
+                    "WoW terms expanded: %r → %r",
+                    text_to_translate[:_LOG_PREVIEW], wow_expanded[:_LOG_PREVIEW],
+                )
             text_to_translate = wow_expanded
 
         # --- STREAMING: emit original immediately, then update with translation ---
@@ -384,7 +455,7 @@ class TranslationPipeline:
         logger.info("DeepL result: success=%s, translated=%r", result.success, translated_preview)
 
         # If DeepL auto-detected own language, skip (e.g. "zerg" detected as RU)
-        own_deepl = _LINGUA_TO_DEEPL.get(cfg.own_language, "")
+        own_deepl = snapshot.own_deepl
         if result.success and not source_lang and result.source_lang == own_deepl:
             logger.info("DeepL detected own lang (%s), skipping: %r", own_deepl, cleaned_text[:_LOG_PREVIEW])
             return  # original already emitted above
@@ -401,7 +472,7 @@ class TranslationPipeline:
         # Cache successful translations (use DeepL-detected source if auto)
         if result.success:
             cache_src = source_lang or result.source_lang
-            self._cache.put(cleaned_text, cache_src, target_lang, result.translated)
+            self._cache.put(cleaned_text, cache_src, target_lang, result.translated, defer=True)
 
         # --- STREAMING: emit translation update ---
         self._on_message(TranslatedMessage(
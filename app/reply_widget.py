@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
+from functools import partial
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QKeyEvent
 from PyQt6.QtWidgets import (
     QApplication,
@@ -15,11 +17,13 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.overlay import ReplyTranslateWorker
 from app.translator import TranslatorService
 
 logger = logging.getLogger(__name__)
 
 DEBOUNCE_MS = 300
+PREVIEW_CACHE_SIZE = 64
 
 
 class ReplyWidget(QWidget):
@@ -27,6 +31,13 @@ class ReplyWidget(QWidget):
 
     When visible (interactive mode), user types a message, sees a live
     translation preview, presses Enter to copy to clipboard.
+
+    Translations run in a thread pool so the GUI never waits on DeepL.
+    Every request gets an id; a result whose id is no longer the latest
+    (newer keystroke, Enter, or the widget was closed) is dropped. Enter
+    on text whose preview is still in flight waits for that request.
+    Successful translations are kept in a small LRU, so retyping a text
+    or pressing Enter on the previewed text doesn't call DeepL again.
     """
 
     reply_sent = pyqtSignal(str)  # emits translated text
@@ -45,6 +56,13 @@ class ReplyWidget(QWidget):
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.setInterval(DEBOUNCE_MS)
         self._debounce_timer.timeout.connect(self._do_translate)
+        self._thread_pool = QThreadPool()
+        self._request_id = 0
+        self._preview_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._last_translated_text = ""  # text the preview currently shows
+        self._stripped_text = ""  # input text, stripped once per edit
+        self._pending: tuple[int, str, str] | None = None  # in-flight (request_id, text, target)
+        self._send_on_result = False  # Enter is waiting for the in-flight translation
 
         self._setup_ui()
         self.hide()
@@ -56,9 +74,12 @@ class ReplyWidget(QWidget):
     @target_lang.setter
     def target_lang(self, lang: str) -> None:
         self._target_lang = lang
+        self._preview_cache.clear()
+        self._last_translated_text = ""
 
     def set_translator(self, translator: TranslatorService) -> None:
         self._translator = translator
+        self._preview_cache.clear()
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -104,14 +125,21 @@ class ReplyWidget(QWidget):
         """Show and focus the reply widget."""
         self._input.clear()
         self._preview.setText("")
+        self._last_translated_text = ""
         self._lang_label.setText(self._target_lang)
         self.show()
         self._input.setFocus()
 
     def deactivate(self) -> None:
         """Hide the reply widget."""
+        self._request_id += 1  # drop results of in-flight requests
+        self._pending = None
+        self._send_on_result = False
+        self._debounce_timer.stop()
+        self._input.setEnabled(True)
         self._input.clear()
         self._preview.setText("")
+        self._last_translated_text = ""
         self.hide()
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
@@ -122,34 +150,96 @@ class ReplyWidget(QWidget):
             super().keyPressEvent(event)
 
     def _on_text_changed(self, text: str) -> None:
-        if text.strip():
+        self._stripped_text = text.strip()
+        if self._stripped_text:
             self._debounce_timer.start()
         else:
+            self._request_id += 1
             self._preview.setText("")
+            self._last_translated_text = ""
 
     def _do_translate(self) -> None:
-        text = self._input.text().strip()
+        text = self._stripped_text
         if not text or not self._translator:
             return
 
-        result = self._translator.translate(text, target_lang=self._target_lang)
-        if result.success:
-            self._preview.setText(f"→ {result.translated}")
+        self._request_id += 1
+        if text == self._last_translated_text:
+            return  # typed and deleted back to what the preview shows
+        cached = self._cached_translation(text)
+        if cached is not None:
+            self._preview.setText(f"→ {cached}")
+            self._last_translated_text = text
+            return
+
+        self._submit(text)
+
+    def _submit(self, text: str) -> None:
+        """Translate text in the pool under the current request id."""
+        request = (self._request_id, text, self._target_lang)
+        self._pending = request
+        worker = ReplyTranslateWorker(self._translator, text, self._target_lang)
+        worker.signals.finished.connect(partial(self._on_translated, *request))
+        self._thread_pool.start(worker)
+
+    def _on_translated(
+        self, request_id: int, text: str, target_lang: str, translated: str, success: bool,
+    ) -> None:
+        if success:
+            self._cache_translation(text, target_lang, translated)
+        if request_id != self._request_id:
+            return  # stale: the text changed, or Esc, while this was in flight
+        self._pending = None
+        if success:
+            self._preview.setText(f"→ {translated}")
+            self._last_translated_text = text
         else:
             self._preview.setText("(translation failed)")
+        if self._send_on_result:
+            self._send_on_result = False
+            self._input.setEnabled(True)
+            # A failed translation carries the original text, which is sent as is
+            self._send(translated)
 
     def _on_enter(self) -> None:
-        text = self._input.text().strip()
+        text = self._stripped_text
         if not text:
             return
 
-        # Get translated text from preview, or translate now
-        if self._translator:
-            result = self._translator.translate(text, target_lang=self._target_lang)
-            translated = result.translated if result.success else text
-        else:
-            translated = text
+        self._debounce_timer.stop()
+        if not self._translator:
+            self._send(text)
+            return
+        cached = self._cached_translation(text)
+        if cached is not None:
+            self._send(cached)
+            return
 
+        # Send when the translation arrives; the input stays disabled until then.
+        # If the debounce preview for this exact text is still in flight, wait
+        # for it instead of asking DeepL a second time.
+        self._input.setEnabled(False)
+        self._send_on_result = True
+        if self._pending != (self._request_id, text, self._target_lang):
+            self._request_id += 1
+            self._submit(text)
+
+    def _cached_translation(self, text: str) -> str | None:
+        key = (text, self._target_lang)
+        translated = self._preview_cache.get(key)
+        if translated is not None:
+            self._preview_cache.move_to_end(key)
+        return translated
+
+    def _cache_translation(self, text: str, target_lang: str, translated: str) -> None:
+        # Keyed by target too: a result may land after the target changed
+        key = (text, target_lang)
+        self._preview_cache[key] = translated
+        self._preview_cache.move_to_end(key)
+        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+
+    def _send(self, translated: str) -> None:
         # Copy to clipboard
         clipboard = QApplication.clipboard()
         if clipboard:
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-import shutil
 import sys
+from functools import cache
 from pathlib import Path
 
 import deepl
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QIcon, QKeyEvent, QPainter, QPixmap
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QIcon,
+    QKeyEvent,
+    QPainter,
+    QPixmap,
+    QStandardItem,
+    QStandardItemModel,
+)
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -32,6 +41,7 @@ from PyQt6.QtWidgets import (
 )
 
 from app.about_dialog import VERSION
+from app.addon_installer import ADDON_NAME, ADDON_SOURCE, install_addon
 from app.config import AppConfig, detect_wow_path
 from app.i18n import UI_LANGUAGES, tr
 
@@ -61,6 +71,28 @@ LANGUAGES = {
     "ZH": "Chinese",
 }
 
+
+# Row of each code in the shared combo models (-1, like findData, if unknown)
+_LANGUAGE_INDEX = {code: i for i, code in enumerate(LANGUAGES)}
+_UI_LANGUAGE_INDEX = {code: i for i, code in enumerate(UI_LANGUAGES)}
+
+
+@cache
+def _language_model(ui: bool) -> QStandardItemModel:
+    """Combo model listing UI languages or DeepL languages, built once.
+
+    Every settings dialog shares it, so opening the dialog sets one model
+    per combo instead of replaying addItem for each language. Built on
+    first use, since Qt objects shouldn't be created at import.
+    """
+    model = QStandardItemModel()
+    for code, name in (UI_LANGUAGES if ui else LANGUAGES).items():
+        item = QStandardItem(name if ui else f"{name} ({code})")
+        item.setData(code, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+    return model
+
+
 # WoW-inspired dark theme stylesheet
 WOW_THEME_STYLESHEET = """
 QDialog {
@@ -209,6 +241,10 @@ QProgressBar::chunk {
     border-radius: 3px;
 }
 
+QProgressBar[tier="ok"]::chunk { background: #FFD200; }
+QProgressBar[tier="warn"]::chunk { background: #FF7F00; }
+QProgressBar[tier="crit"]::chunk { background: #FF4040; }
+
 QLabel {
     color: #ccc;
 }
@@ -216,9 +252,71 @@ QLabel {
 QDialogButtonBox QPushButton {
     min-width: 80px;
 }
+
+QPushButton[role="gold"] {
+    background: #3a3000;
+    color: #FFD200;
+    border: 1px solid #FFD200;
+}
+QPushButton[role="gold"]:hover {
+    background: #4a4000;
+}
+QPushButton[role="gold"]:pressed {
+    background: #555;
+}
+QDialogButtonBox QPushButton[role="gold"] {
+    padding: 8px 20px;
+}
+
+QLabel#hotkeyLabel {
+    color: #FFD200;
+    font-weight: bold;
+    font-size: 12px;
+    padding: 4px 8px;
+    background: #111;
+    border: 1px solid #555;
+    border-radius: 3px;
+}
+QLabel#hotkeyLabel[recording="true"] {
+    color: #40FF40;
+    border-color: #40FF40;
+}
+
+QLabel#cryptoLabel {
+    color: #ccc;
+    font-size: 11px;
+}
+QLineEdit#cryptoAddr {
+    color: #e0e0e0;
+    font-size: 10px;
+    background: #111;
+    border: 1px solid #444;
+    border-radius: 3px;
+    padding: 4px;
+}
+
+QLabel[status="unconfigured"] { color: #999; font-weight: bold; }
+QLabel[status="valid"] { color: #40FF40; font-weight: bold; }
+QLabel[status="invalid"] { color: #FF4040; font-weight: bold; }
+QLabel[status="error"] { color: #FF7F00; font-weight: bold; }
 """
 
 
+def _set_style_state(widget: QWidget, name: str, value: str) -> None:
+    """Switch a dynamic property matched by a theme selector and re-polish.
+
+    Qt only re-evaluates property selectors on polish, but this is far
+    cheaper than giving the widget its own stylesheet to parse.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    if style is not None:
+        style.unpolish(widget)
+        style.polish(widget)
+
+
 class HotkeyEdit(QWidget):
     """Widget for capturing keyboard shortcuts: shows current combo + Change button."""
 
@@ -231,6 +329,9 @@ class HotkeyEdit(QWidget):
         Qt.Key.Key_Meta: "Win",
     }
 
+    # Key code -> name without the "Key_" prefix, for keys outside A-Z/F1-F12
+    _KEY_NAMES = {k.value: k.name[4:] for k in Qt.Key}
+
     def __init__(self, current: str, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._hotkey = current
@@ -241,10 +342,7 @@ class HotkeyEdit(QWidget):
         layout.setSpacing(4)
 
         self._label = QLabel(current or tr("settings.hk.none"))
-        self._label.setStyleSheet(
-            "color: #FFD200; font-weight: bold; font-size: 12px; padding: 4px 8px;"
-            "background: #111; border: 1px solid #555; border-radius: 3px;"
-        )
+        self._label.setObjectName("hotkeyLabel")
         self._label.setMinimumWidth(140)
         layout.addWidget(self._label)
 
@@ -266,10 +364,7 @@ class HotkeyEdit(QWidget):
     def _start_recording(self) -> None:
         self._recording = True
         self._label.setText(tr("settings.hk.press_keys"))
-        self._label.setStyleSheet(
-            "color: #40FF40; font-weight: bold; font-size: 12px; padding: 4px 8px;"
-            "background: #111; border: 1px solid #40FF40; border-radius: 3px;"
-        )
+        _set_style_state(self._label, "recording", "true")
         self._btn.setText(tr("settings.hk.cancel"))
         self._btn.clicked.disconnect()
         self._btn.clicked.connect(self._cancel_recording)
@@ -278,10 +373,7 @@ class HotkeyEdit(QWidget):
     def _cancel_recording(self) -> None:
         self._recording = False
         self._label.setText(self._hotkey or tr("settings.hk.none"))
-        self._label.setStyleSheet(
-            "color: #FFD200; font-weight: bold; font-size: 12px; padding: 4px 8px;"
-            "background: #111; border: 1px solid #555; border-radius: 3px;"
-        )
+        _set_style_state(self._label, "recording", "false")
         self._btn.setText(tr("settings.hk.change"))
         self._btn.clicked.disconnect()
         self._btn.clicked.connect(self._start_recording)
@@ -321,11 +413,7 @@ class HotkeyEdit(QWidget):
             self._cancel_recording()
             return
         else:
-            # Try Qt enum name
-            try:
-                key_name = Qt.Key(key).name.replace("Key_", "")
-            except (ValueError, AttributeError):
-                key_name = f"0x{key:X}"
+            key_name = self._KEY_NAMES.get(key) or f"0x{key:X}"
 
         if not parts:
             # Require at least one modifier
@@ -336,23 +424,69 @@ class HotkeyEdit(QWidget):
         self._hotkey = combo
         self._label.setText(combo)
         self._recording = False
-        self._label.setStyleSheet(
-            "color: #FFD200; font-weight: bold; font-size: 12px; padding: 4px 8px;"
-            "background: #111; border: 1px solid #555; border-radius: 3px;"
-        )
+        _set_style_state(self._label, "recording", "false")
         self._btn.setText(tr("settings.hk.change"))
         self._btn.clicked.disconnect()
         self._btn.clicked.connect(self._start_recording)
         self.hotkey_changed.emit(combo)
 
 
+class _UsageSignals(QObject):
+    """Signals for UsageCheckWorker (QRunnable can't have signals)."""
+    finished = pyqtSignal(object)  # deepl.Usage, or the exception raised
+
+
+class UsageCheckWorker(QRunnable):
+    """Fetches DeepL usage for an API key in the thread pool."""
+
+    def __init__(self, api_key: str) -> None:
+        super().__init__()
+        self.signals = _UsageSignals()
+        self._api_key = api_key
+
+    def run(self) -> None:
+        try:
+            result: deepl.Usage | Exception = deepl.Translator(self._api_key).get_usage()
+        except Exception as e:
+            result = e
+        self.signals.finished.emit(result)
+
+
+class _AddonSignals(QObject):
+    """Signals for AddonInstallWorker (QRunnable can't have signals)."""
+    finished = pyqtSignal(object)  # bool (files written), or the OSError raised
+
+
+class AddonInstallWorker(QRunnable):
+    """Copies the bundled addon into the AddOns folder in the thread pool."""
+
+    def __init__(self, src: Path, dest: Path) -> None:
+        super().__init__()
+        self.signals = _AddonSignals()
+        self._src = src
+        self._dest = dest
+
+    def run(self) -> None:
+        try:
+            result: bool | OSError = install_addon(self._src, self._dest)
+        except OSError as e:
+            result = e
+        self.signals.finished.emit(result)
+
+
+_ICON_CANDIDATES = (
+    Path(getattr(sys, "_MEIPASS", "")) / "assets" / "icon.ico",
+    Path(__file__).parent.parent / "assets" / "icon.ico",
+)
+
+
+@cache
 def _create_dialog_icon() -> QIcon:
-    """Load icon from .ico file, or generate programmatically as fallback."""
-    candidates = [
-        Path(getattr(sys, "_MEIPASS", "")) / "assets" / "icon.ico",
-        Path(__file__).parent.parent / "assets" / "icon.ico",
-    ]
-    for path in candidates:
+    """Load icon from .ico file, or generate programmatically as fallback.
+
+    Cached: QIcon is a shared handle, so every dialog can reuse one.
+    """
+    for path in _ICON_CANDIDATES:
         if path.is_file():
             return QIcon(str(path))
 
@@ -371,6 +505,14 @@ def _create_dialog_icon() -> QIcon:
 
 _SETTINGS_DIALOG_POS_FILE = "settings_dialog_pos.json"
 
+# Channel toggles in grid order (3 per row); each maps to config.channels_<name>
+_CHANNELS = ("party", "raid", "guild", "say", "whisper", "instance")
+
+TAB_GENERAL = 0
+TAB_OVERLAY = 1
+TAB_HOTKEYS = 2
+TAB_ABOUT = 3
+
 
 class SettingsDialog(QDialog):
     """Settings window with WoW-themed dark UI."""
@@ -378,6 +520,7 @@ class SettingsDialog(QDialog):
     def __init__(self, config: AppConfig, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._config = config
+        self._validating = False  # a key check is in flight
         self.setWindowTitle(tr("settings.title"))
         self.setWindowIcon(_create_dialog_icon())
         self.setMinimumSize(500, 520)
@@ -386,13 +529,21 @@ class SettingsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # Tab widget
-        tabs = QTabWidget()
-        tabs.addTab(self._create_general_tab(), tr("settings.tab.general"))
-        tabs.addTab(self._create_overlay_tab(), tr("settings.tab.overlay"))
-        tabs.addTab(self._create_hotkeys_tab(), tr("settings.tab.hotkeys"))
-        tabs.addTab(self._create_about_tab(), tr("settings.tab.about"))
-        layout.addWidget(tabs)
+        # Tab widget — only General is built up front; the others are
+        # placeholders filled in the first time they are shown.
+        self._tabs = QTabWidget()
+        self._tabs.addTab(self._create_general_tab(), tr("settings.tab.general"))
+        self._tab_builders = {
+            TAB_OVERLAY: self._create_overlay_tab,
+            TAB_HOTKEYS: self._create_hotkeys_tab,
+            TAB_ABOUT: self._create_about_tab,
+        }
+        for title in ("settings.tab.overlay", "settings.tab.hotkeys", "settings.tab.about"):
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self._tabs.addTab(placeholder, tr(title))
+        self._tabs.currentChanged.connect(self._build_tab)
+        layout.addWidget(self._tabs)
 
         # Buttons
         buttons = QDialogButtonBox(
@@ -404,18 +555,21 @@ class SettingsDialog(QDialog):
         # Gold-styled Save button
         ok_btn = buttons.button(QDialogButtonBox.StandardButton.Ok)
         ok_btn.setText(tr("settings.save"))
-        ok_btn.setStyleSheet(
-            "QPushButton { background: #3a3000; color: #FFD200; "
-            "border: 1px solid #FFD200; border-radius: 3px; padding: 8px 20px; }"
-            "QPushButton:hover { background: #4a4000; }"
-            "QPushButton:pressed { background: #555; }"
-        )
+        ok_btn.setProperty("role", "gold")
 
         cancel_btn = buttons.button(QDialogButtonBox.StandardButton.Cancel)
         cancel_btn.setText(tr("wizard.cancel"))
 
         layout.addWidget(buttons)
 
+    def _build_tab(self, index: int) -> None:
+        """Build a deferred tab's contents into its placeholder on first view."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self._tabs.widget(index)
+        placeholder.layout().addWidget(builder())
+
     # ── General Tab ──────────────────────────────────────────────
 
     def _create_general_tab(self) -> QWidget:
@@ -443,14 +597,11 @@ class SettingsDialog(QDialog):
 
         addon_row = QHBoxLayout()
         self._install_addon_btn = QPushButton(tr("settings.wow.install_addon"))
-        self._install_addon_btn.setStyleSheet(
-            "QPushButton { background: #3a3000; color: #FFD200; "
-            "border: 1px solid #FFD200; border-radius: 3px; padding: 6px 14px; }"
-            "QPushButton:hover { background: #4a4000; }"
-        )
+        self._install_addon_btn.setProperty("role", "gold")
         self._install_addon_btn.clicked.connect(self._install_addon)
         addon_row.addWidget(self._install_addon_btn)
         self._addon_status = QLabel("")
+        self._addon_status.setTextFormat(Qt.TextFormat.PlainText)
         self._addon_status.setWordWrap(True)
         addon_row.addWidget(self._addon_status, stretch=1)
         path_layout.addRow("", addon_row)
@@ -462,24 +613,22 @@ class SettingsDialog(QDialog):
         lang_layout = QFormLayout(lang_group)
 
         self._ui_lang = QComboBox()
-        for code, name in UI_LANGUAGES.items():
-            self._ui_lang.addItem(name, code)
+        self._ui_lang.setModel(_language_model(ui=True))
         self._ui_lang.setCurrentIndex(
-            self._ui_lang.findData(self._config.ui_language)
+            _UI_LANGUAGE_INDEX.get(self._config.ui_language, -1)
         )
         lang_layout.addRow(tr("settings.lang.ui"), self._ui_lang)
 
         self._own_lang = QComboBox()
         self._target_lang = QComboBox()
-        for code, name in LANGUAGES.items():
-            self._own_lang.addItem(f"{name} ({code})", code)
-            self._target_lang.addItem(f"{name} ({code})", code)
+        self._own_lang.setModel(_language_model(ui=False))
+        self._target_lang.setModel(_language_model(ui=False))
 
         self._own_lang.setCurrentIndex(
-            self._own_lang.findData(self._config.own_language)
+            _LANGUAGE_INDEX.get(self._config.own_language, -1)
         )
         self._target_lang.setCurrentIndex(
-            self._target_lang.findData(self._config.target_language)
+            _LANGUAGE_INDEX.get(self._config.target_language, -1)
         )
         lang_layout.addRow(tr("settings.lang.own"), self._own_lang)
         lang_layout.addRow(tr("settings.lang.target"), self._target_lang)
@@ -488,24 +637,12 @@ class SettingsDialog(QDialog):
         # Channels — 3-column grid
         ch_group = QGroupBox(tr("settings.channels_group"))
         ch_grid = QGridLayout(ch_group)
-        self._ch_party = QCheckBox(tr("settings.ch.party"))
-        self._ch_party.setChecked(self._config.channels_party)
-        self._ch_raid = QCheckBox(tr("settings.ch.raid"))
-        self._ch_raid.setChecked(self._config.channels_raid)
-        self._ch_guild = QCheckBox(tr("settings.ch.guild"))
-        self._ch_guild.setChecked(self._config.channels_guild)
-        self._ch_say = QCheckBox(tr("settings.ch.say"))
-        self._ch_say.setChecked(self._config.channels_say)
-        self._ch_whisper = QCheckBox(tr("settings.ch.whisper"))
-        self._ch_whisper.setChecked(self._config.channels_whisper)
-        self._ch_instance = QCheckBox(tr("settings.ch.instance"))
-        self._ch_instance.setChecked(self._config.channels_instance)
-        ch_grid.addWidget(self._ch_party, 0, 0)
-        ch_grid.addWidget(self._ch_raid, 0, 1)
-        ch_grid.addWidget(self._ch_guild, 0, 2)
-        ch_grid.addWidget(self._ch_say, 1, 0)
-        ch_grid.addWidget(self._ch_whisper, 1, 1)
-        ch_grid.addWidget(self._ch_instance, 1, 2)
+        self._channels: dict[str, QCheckBox] = {}
+        for i, name in enumerate(_CHANNELS):
+            checkbox = QCheckBox(tr(f"settings.ch.{name}"))
+            checkbox.setChecked(getattr(self._config, f"channels_{name}"))
+            ch_grid.addWidget(checkbox, i // 3, i % 3)
+            self._channels[name] = checkbox
         layout.addWidget(ch_group)
 
         layout.addStretch()
@@ -530,6 +667,7 @@ class SettingsDialog(QDialog):
         action_row.addWidget(self._validate_btn)
 
         self._api_status_label = QLabel("")
+        self._api_status_label.setTextFormat(Qt.TextFormat.PlainText)
         self._api_status_label.setWordWrap(True)
         action_row.addWidget(self._api_status_label, stretch=1)
 
@@ -571,73 +709,73 @@ class SettingsDialog(QDialog):
 
     def _validate_api_key(self) -> None:
         """Test the API key and show usage stats."""
+        if self._validating:
+            return
         key = self._api_key_input.text().strip()
         if not key:
             self._set_api_status("unconfigured", tr("settings.api.no_key"))
             self._usage_widget.hide()
             return
 
+        self._validating = True
         self._validate_btn.setEnabled(False)
         self._validate_btn.setText(tr("settings.api.validating"))
-        QApplication.processEvents()
 
-        try:
-            translator = deepl.Translator(key)
-            usage = translator.get_usage()
-
-            if usage.character and usage.character.valid:
-                count = usage.character.count
-                limit = usage.character.limit
-                pct = int((count / limit) * 100) if limit else 0
-
-                self._usage_bar.setValue(pct)
-                self._usage_detail_label.setText(
-                    f"{count:,} / {limit:,} ({pct}%)"
-                )
-
-                if pct >= 90:
-                    bar_color = "#FF4040"
-                elif pct >= 70:
-                    bar_color = "#FF7F00"
-                else:
-                    bar_color = "#FFD200"
-                self._usage_bar.setStyleSheet(
-                    f"QProgressBar::chunk {{ background: {bar_color}; border-radius: 3px; }}"
-                )
-
-                self._usage_widget.show()
-                self._set_api_status("valid", tr("settings.api.valid"))
-            else:
-                self._set_api_status("valid", tr("settings.api.valid_no_data"))
-                self._usage_widget.hide()
+        # The network round-trip runs off the UI thread; the dialog stays
+        # responsive and _on_usage_checked picks up the result.
+        worker = UsageCheckWorker(key)
+        worker.signals.finished.connect(self._on_usage_checked)
+        QThreadPool.globalInstance().start(worker)
 
-        except deepl.AuthorizationException:
+    def _on_usage_checked(self, result: deepl.Usage | Exception) -> None:
+        self._validating = False
+        self._validate_btn.setEnabled(True)
+        self._validate_btn.setText(tr("settings.api.validate"))
+
+        if isinstance(result, deepl.AuthorizationException):
             self._set_api_status("invalid", tr("settings.api.invalid"))
             self._usage_widget.hide()
-        except Exception as e:
-            self._set_api_status("error", tr("settings.api.error", e=e))
+            return
+        if isinstance(result, Exception):
+            self._set_api_status("error", tr("settings.api.error", e=result))
+            self._usage_widget.hide()
+            return
+
+        usage = result
+        if usage.character and usage.character.valid:
+            count = usage.character.count
+            limit = usage.character.limit
+            pct = int((count / limit) * 100) if limit else 0
+
+            self._usage_bar.setValue(pct)
+            self._usage_detail_label.setText(
+                f"{count:,} / {limit:,} ({pct}%)"
+            )
+
+            if pct >= 90:
+                tier = "crit"
+            elif pct >= 70:
+                tier = "warn"
+            else:
+                tier = "ok"
+            _set_style_state(self._usage_bar, "tier", tier)
+
+            self._usage_widget.show()
+            self._set_api_status("valid", tr("settings.api.valid"))
+        else:
+            self._set_api_status("valid", tr("settings.api.valid_no_data"))
             self._usage_widget.hide()
-        finally:
-            self._validate_btn.setEnabled(True)
-            self._validate_btn.setText(tr("settings.api.validate"))
 
     def _set_api_status(self, state: str, message: str) -> None:
-        colors = {
-            "unconfigured": "#999",
-            "valid": "#40FF40",
-            "invalid": "#FF4040",
-            "error": "#FF7F00",
-        }
         icons = {
             "unconfigured": "\u2022",
             "valid": "\u2713",
             "invalid": "\u2717",
             "error": "\u26A0",
         }
-        color = colors.get(state, "#999")
         icon = icons.get(state, "")
         self._api_status_label.setText(f"{icon} {message}")
-        self._api_status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        _set_style_state(self._api_status_label, "status", state if state in icons else "unconfigured")
 
     def _update_api_status_indicator(self) -> None:
         if self._config.deepl_api_key:
@@ -824,29 +962,32 @@ class SettingsDialog(QDialog):
         ]:
             row = QHBoxLayout()
             crypto_label = QLabel(f"<b>{label}:</b>")
-            crypto_label.setStyleSheet("color: #ccc; font-size: 11px;")
+            crypto_label.setObjectName("cryptoLabel")
             crypto_label.setFixedWidth(90)
             row.addWidget(crypto_label)
 
             addr_field = QLineEdit(addr)
             addr_field.setReadOnly(True)
-            addr_field.setStyleSheet(
-                "color: #e0e0e0; font-size: 10px; background: #111; "
-                "border: 1px solid #444; border-radius: 3px; padding: 4px;"
-            )
+            addr_field.setObjectName("cryptoAddr")
             row.addWidget(addr_field)
 
             copy_btn = QPushButton(tr("overlay.reply.copy"))
             copy_btn.setFixedWidth(80)
-            copy_btn.clicked.connect(
-                lambda checked, a=addr: QApplication.clipboard().setText(a)
-            )
+            copy_btn.setProperty("crypto_addr", addr)
+            copy_btn.clicked.connect(self._copy_crypto_address)
             row.addWidget(copy_btn)
             layout.addLayout(row)
 
         layout.addStretch()
         return tab
 
+    def _copy_crypto_address(self) -> None:
+        """Copy the address stored on whichever donate button was clicked."""
+        btn = self.sender()
+        clipboard = QApplication.clipboard()
+        if btn is not None and clipboard is not None:
+            clipboard.setText(btn.property("crypto_addr"))
+
     # ── Actions ──────────────────────────────────────────────────
 
     def _browse_wow_path(self) -> None:
@@ -863,7 +1004,7 @@ class SettingsDialog(QDialog):
         wow = self._wow_path_input.text().strip()
         if not wow:
             self._addon_status.setText(tr("settings.wow.addon_no_path"))
-            self._addon_status.setStyleSheet("color: #FF4040; font-weight: bold;")
+            _set_style_state(self._addon_status, "status", "invalid")
             return
 
         addons_dir = Path(wow) / "_retail_" / "Interface" / "AddOns"
@@ -871,55 +1012,64 @@ class SettingsDialog(QDialog):
             self._addon_status.setText(
                 tr("settings.wow.addon_not_found", path=addons_dir.parent)
             )
-            self._addon_status.setStyleSheet("color: #FF4040; font-weight: bold;")
+            _set_style_state(self._addon_status, "status", "invalid")
             return
 
-        if getattr(sys, "frozen", False):
-            src = Path(getattr(sys, "_MEIPASS", "")) / "addon" / "BabelChat"
-        else:
-            src = Path(__file__).resolve().parent.parent / "addon" / "BabelChat"
-
+        src = ADDON_SOURCE
         if not src.exists():
             self._addon_status.setText(tr("settings.wow.addon_files_missing"))
-            self._addon_status.setStyleSheet("color: #FF4040; font-weight: bold;")
+            _set_style_state(self._addon_status, "status", "invalid")
             return
 
-        dest = addons_dir / "BabelChat"
-        try:
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(src, dest)
-            self._addon_status.setText(tr("settings.wow.addon_installed"))
-            self._addon_status.setStyleSheet("color: #40FF40; font-weight: bold;")
-            self._install_addon_btn.setText(tr("settings.wow.reinstall_addon"))
-        except OSError as e:
-            self._addon_status.setText(f"\u2717 {e}")
-            self._addon_status.setStyleSheet("color: #FF4040; font-weight: bold;")
+        self._install_addon_btn.setEnabled(False)
+        worker = AddonInstallWorker(src, addons_dir / ADDON_NAME)
+        worker.signals.finished.connect(self._on_addon_installed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_addon_installed(self, result: bool | OSError) -> None:
+        self._install_addon_btn.setEnabled(True)
+        if isinstance(result, OSError):
+            self._addon_status.setText(f"\u2717 {result}")
+            _set_style_state(self._addon_status, "status", "invalid")
+            return
+        key = "settings.wow.addon_installed" if result else "settings.wow.addon_up_to_date"
+        self._addon_status.setText(tr(key))
+        _set_style_state(self._addon_status, "status", "valid")
+        self._install_addon_btn.setText(tr("settings.wow.reinstall_addon"))
 
     def _save_and_accept(self) -> None:
-        self._config.deepl_api_key = self._api_key_input.text().strip()
-        self._config.wow_path = self._wow_path_input.text().strip()
-        self._config.ui_language = self._ui_lang.currentData()
-        self._config.own_language = self._own_lang.currentData()
-        self._config.target_language = self._target_lang.currentData()
-        self._config.channels_party = self._ch_party.isChecked()
-        self._config.channels_raid = self._ch_raid.isChecked()
-        self._config.channels_guild = self._ch_guild.isChecked()
-        self._config.channels_say = self._ch_say.isChecked()
-        self._config.channels_whisper = self._ch_whisper.isChecked()
-        self._config.channels_instance = self._ch_instance.isChecked()
-        self._config.overlay_opacity = self._opacity_slider.value()
-        self._config.overlay_font_size = self._font_size.value()
-        self._config.translation_enabled_default = self._translate_default.isChecked()
-        self._config.skip_own_messages = self._skip_own_messages.isChecked()
-        self._config.show_debug_console = self._show_console.isChecked()
-        self._config.hotkey_toggle_translate = self._hk_toggle.text()
-        self._config.hotkey_clipboard_translate = self._hk_clipboard.text()
+        values: dict[str, object] = {
+            "deepl_api_key": self._api_key_input.text().strip(),
+            "wow_path": self._wow_path_input.text().strip(),
+            "ui_language": self._ui_lang.currentData(),
+            "own_language": self._own_lang.currentData(),
+            "target_language": self._target_lang.currentData(),
+        }
+        for name, checkbox in self._channels.items():
+            values[f"channels_{name}"] = checkbox.isChecked()
+        # Tabs never opened still show the config values, nothing to read
+        if TAB_OVERLAY not in self._tab_builders:
+            values["overlay_opacity"] = self._opacity_slider.value()
+            values["overlay_font_size"] = self._font_size.value()
+            values["translation_enabled_default"] = self._translate_default.isChecked()
+            values["skip_own_messages"] = self._skip_own_messages.isChecked()
+            values["show_debug_console"] = self._show_console.isChecked()
+        if TAB_HOTKEYS not in self._tab_builders:
+            values["hotkey_toggle_translate"] = self._hk_toggle.text()
+            values["hotkey_clipboard_translate"] = self._hk_clipboard.text()
+
+        changed = False
+        for name, value in values.items():
+            if getattr(self._config, name) != value:
+                setattr(self._config, name, value)
+                changed = True
         # Apply UI language change
         new_lang = self._ui_lang.currentData()
         if new_lang != tr.get_language():
             tr.set_language(new_lang)
-        self._config.save()
+        # Unchanged settings skip the backup + atomic rewrite of the file
+        if changed:
+            self._config.save()
         self.accept()
 
     def _restore_position(self) -> None:
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import shutil
-import sys
+from functools import partial
 from pathlib import Path
 
 import deepl
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -24,11 +23,13 @@ from PyQt6.QtWidgets import (
 )
 
 from app.about_dialog import _create_logo_pixmap
+from app.addon_installer import ADDON_NAME, ADDON_SOURCE
 from app.config import AppConfig, detect_wow_path
 from app.i18n import UI_LANGUAGES, tr
 from app.settings_dialog import (
     LANGUAGES,
     WOW_THEME_STYLESHEET,
+    AddonInstallWorker,
     _create_dialog_icon,
 )
 
@@ -525,16 +526,6 @@ class SetupWizard(QDialog):
         layout.addStretch()
         return page
 
-    @staticmethod
-    def _addon_source_path() -> Path:
-        """Return path to bundled BabelChat addon folder."""
-        if getattr(sys, "frozen", False):
-            # PyInstaller onefile: data extracted to _MEIPASS temp dir
-            base = Path(getattr(sys, "_MEIPASS", ""))
-        else:
-            base = Path(__file__).resolve().parent.parent
-        return base / "addon" / "BabelChat"
-
     def _install_addon(self) -> None:
         wow = self._wow_path_input.text().strip()
         if not wow:
@@ -554,7 +545,7 @@ class SetupWizard(QDialog):
             )
             return
 
-        src = self._addon_source_path()
+        src = ADDON_SOURCE
         if not src.exists():
             self._addon_status_label.setText(
                 tr("wizard.ready.addon_files_missing")
@@ -564,23 +555,26 @@ class SetupWizard(QDialog):
             )
             return
 
-        dest = addons_dir / "BabelChat"
-        try:
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(src, dest)
-            self._addon_status_label.setText(
-                tr("wizard.ready.addon_installed", dest=dest)
-            )
-            self._addon_status_label.setStyleSheet(
-                "color: #40FF40; font-weight: bold;"
-            )
-            self._install_addon_btn.setText(tr("wizard.ready.reinstall_addon"))
-        except OSError as e:
-            self._addon_status_label.setText(f"\u2717 {e}")
+        dest = addons_dir / ADDON_NAME
+        self._install_addon_btn.setEnabled(False)
+        worker = AddonInstallWorker(src, dest)
+        worker.signals.finished.connect(partial(self._on_addon_installed, dest))
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_addon_installed(self, dest: Path, result: bool | OSError) -> None:
+        self._install_addon_btn.setEnabled(True)
+        if isinstance(result, OSError):
+            self._addon_status_label.setText(f"\u2717 {result}")
             self._addon_status_label.setStyleSheet(
                 "color: #FF4040; font-weight: bold;"
             )
+            return
+        key = "wizard.ready.addon_installed" if result else "wizard.ready.addon_up_to_date"
+        self._addon_status_label.setText(tr(key, dest=dest))
+        self._addon_status_label.setStyleSheet(
+            "color: #40FF40; font-weight: bold;"
+        )
+        self._install_addon_btn.setText(tr("wizard.ready.reinstall_addon"))
 
     def _update_summary(self) -> None:
         key = self._api_key_input.text().strip()
@@ -13,6 +13,9 @@ _RE_WOW_MARKERS = re.compile(
     re.IGNORECASE,
 )
 
+# WoW color codes that leak into chat log: |cAARRGGBB and |r
+_RE_COLOR_CODES = re.compile(r"\|c[0-9a-fA-F]{8}|\|r")
+
 # URLs
 _RE_URL = re.compile(
     r"https?://[^\s<>\"]+|www\.[^\s<>\"]+",
@@ -37,10 +40,14 @@ def strip_for_translation(text: str) -> tuple[str, list[tuple[str, str]]]:
         return placeholder
 
     result = text
-    # Order matters: WoW links first (they contain special chars), then URLs, then markers
-    result = RE_WOW_LINK.sub(replace_token, result)
-    result = _RE_URL.sub(replace_token, result)
-    result = _RE_WOW_MARKERS.sub(replace_token, result)
+    # Order matters: WoW links first (they contain special chars), then URLs, then markers.
+    # Each pass is skipped when the text lacks a character every match needs.
+    if "|" in result:
+        result = RE_WOW_LINK.sub(replace_token, result)
+    if "." in result or "://" in result:
+        result = _RE_URL.sub(replace_token, result)
+    if "{" in result:
+        result = _RE_WOW_MARKERS.sub(replace_token, result)
 
     return result, replacements
 
@@ -56,6 +63,6 @@ def restore_tokens(text: str, replacements: list[tuple[str, str]]) -> str:
 def clean_message_text(text: str) -> str:
     """Clean message text of control characters but preserve emoji and unicode."""
     # Remove WoW color codes that leak into chat log
-    cleaned = re.sub(r"\|c[0-9a-fA-F]{8}", "", text)
-    cleaned = re.sub(r"\|r", "", cleaned)
-    return cleaned.strip()
+    if "|" in text:
+        text = _RE_COLOR_CODES.sub("", text)
+    return text.strip()
@@ -0,0 +1,88 @@
+"""Tests for the addon installer."""
+
+import os
+
+from app.addon_installer import MANIFEST_NAME, addon_digest, install_addon
+
+
+def _make_addon(root):
+    (root / "Data").mkdir(parents=True)
+    (root / "BabelChat.toc").write_text("## Title: BabelChat\n")
+    (root / "Core.lua").write_text("-- core\n")
+    (root / "Data" / "Slang.lua").write_text("-- slang\n")
+    return root
+
+
+def test_first_install_copies_tree(tmp_path):
+    """Fresh install copies every file and writes the manifest."""
+    src = _make_addon(tmp_path / "src")
+    dest = tmp_path / "AddOns" / "BabelChat"
+    assert install_addon(src, dest) is True
+    assert (dest / "Core.lua").read_text() == "-- core\n"
+    assert (dest / "Data" / "Slang.lua").read_text() == "-- slang\n"
+    assert (dest / MANIFEST_NAME).read_text() == addon_digest(src)
+
+
+def test_unchanged_reinstall_is_skipped(tmp_path):
+    """Matching manifest means nothing is touched."""
+    src = _make_addon(tmp_path / "src")
+    dest = tmp_path / "BabelChat"
+    install_addon(src, dest)
+    (dest / "marker.txt").write_text("left alone")
+    assert install_addon(src, dest) is False
+    assert (dest / "marker.txt").exists()
+
+
+def test_damaged_install_is_repaired(tmp_path):
+    """A matching manifest does not hide missing or truncated files."""
+    src = _make_addon(tmp_path / "src")
+    dest = tmp_path / "BabelChat"
+    install_addon(src, dest)
+    (dest / "Data" / "Slang.lua").unlink()
+    assert install_addon(src, dest) is True
+    assert (dest / "Data" / "Slang.lua").read_text() == "-- slang\n"
+
+    (dest / "Core.lua").write_text("")
+    assert install_addon(src, dest) is True
+    assert (dest / "Core.lua").read_text() == "-- core\n"
+
+
+def test_changed_source_is_reinstalled(tmp_path):
+    """A changed source file invalidates the manifest."""
+    src = _make_addon(tmp_path / "src")
+    dest = tmp_path / "BabelChat"
+    install_addon(src, dest)
+    (src / "Core.lua").write_text("-- core v2\n")
+    assert install_addon(src, dest) is True
+    assert (dest / "Core.lua").read_text() == "-- core v2\n"
+
+
+def test_digest_ignores_manifest_and_tracks_paths(tmp_path):
+    """Digest covers relative paths, not the manifest itself."""
+    src = _make_addon(tmp_path / "src")
+    before = addon_digest(src)
+    (src / MANIFEST_NAME).write_text("anything")
+    assert addon_digest(src) == before
+    (src / "Core.lua").rename(src / "Main.lua")
+    assert addon_digest(src) != before
+
+
+def test_resync_rewrites_only_changed_files(tmp_path):
+    """Unchanged files are left in place, stale files and dirs removed."""
+    src = _make_addon(tmp_path / "src")
+    dest = tmp_path / "BabelChat"
+    install_addon(src, dest)
+    # Same bytes but a different mtime, as after a frozen-build re-extract;
+    # a rewrite would copy the source mtime back
+    os.utime(dest / "BabelChat.toc", (1_000_000, 1_000_000))
+    (dest / "Old.lua").write_text("-- removed upstream\n")
+    (dest / "OldDir").mkdir()
+    (dest / "OldDir" / "x.lua").write_text("")
+    (src / "Core.lua").write_text("-- core v2\n")
+
+    assert install_addon(src, dest) is True
+    assert (dest / "BabelChat.toc").stat().st_mtime == 1_000_000
+    assert (dest / "Core.lua").read_text() == "-- core v2\n"
+    assert not (dest / "Old.lua").exists()
+    assert not (dest / "OldDir").exists()
+    assert (dest / MANIFEST_NAME).read_text() == addon_digest(src)
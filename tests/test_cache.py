@@ -117,6 +117,33 @@ class TestCachePersistence:
         c2.close()
 
 
+class TestCacheDeferredWrites:
+    """Test put(defer=True) + flush()."""
+
+    def test_deferred_put_hits_memory_before_flush(self, cache):
+        cache.put("hello", "EN", "RU", "привет", defer=True)
+        assert cache.get("hello", "EN", "RU") == "привет"
+        assert cache.stats()["db_entries"] == 0
+
+    def test_flush_writes_batch(self, cache):
+        for text in ("a", "b", "c"):
+            cache.put(text, "EN", "RU", text.upper(), defer=True)
+        assert cache.flush() == 3
+        assert cache.flush() == 0
+        assert cache.stats()["db_entries"] == 3
+
+    def test_close_flushes(self, tmp_path):
+        db_path = tmp_path / "deferred.db"
+
+        c1 = TranslationCache(db_path=str(db_path))
+        c1.put("hello", "EN", "RU", "привет", defer=True)
+        c1.close()
+
+        c2 = TranslationCache(db_path=str(db_path))
+        assert c2.get("hello", "EN", "RU") == "привет"
+        c2.close()
+
+
 class TestCacheConcurrency:
     """Test thread-safe concurrent access."""
 
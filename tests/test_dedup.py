@@ -2,6 +2,7 @@
 
 import threading
 import time
+from unittest.mock import patch
 
 from app.dedup import DeduplicationBuffer
 
@@ -31,6 +32,17 @@ def test_ttl_expiry():
     assert buf.is_duplicate(("Alice", "hello")) is False
 
 
+def test_size_cap_evicts_oldest():
+    """Past the size cap the oldest keys are dropped first."""
+    buf = DeduplicationBuffer()
+    with patch("app.dedup._DEDUP_MAX_SIZE", 3):
+        for i in range(4):
+            assert buf.is_duplicate(("user", f"msg-{i}")) is False
+        # msg-0 was evicted, msg-3 is still remembered
+        assert buf.is_duplicate(("user", "msg-3")) is True
+        assert buf.is_duplicate(("user", "msg-0")) is False
+
+
 def test_thread_safety():
     """Concurrent inserts from 10 threads should not raise or lose data."""
     buf = DeduplicationBuffer()
@@ -0,0 +1,22 @@
+"""Tests for hotkey string parsing."""
+
+from app.hotkeys import MOD_ALT, MOD_CONTROL, MOD_NOREPEAT, MOD_SHIFT, parse_hotkey
+
+
+def test_letter_with_modifiers():
+    """Modifiers combine into flags, the letter maps to its VK code."""
+    assert parse_hotkey("Ctrl+Shift+T") == (MOD_NOREPEAT | MOD_CONTROL | MOD_SHIFT, 0x54)
+
+
+def test_recorded_key_names():
+    """Names HotkeyEdit records for non-letter keys are registrable."""
+    assert parse_hotkey("Ctrl+Left") == (MOD_NOREPEAT | MOD_CONTROL, 0x25)
+    assert parse_hotkey("Alt+PageUp") == (MOD_NOREPEAT | MOD_ALT, 0x21)
+    assert parse_hotkey("Ctrl+Space") == (MOD_NOREPEAT | MOD_CONTROL, 0x20)
+    assert parse_hotkey("Ctrl+5") == (MOD_NOREPEAT | MOD_CONTROL, 0x35)
+    assert parse_hotkey("Ctrl+F13") == (MOD_NOREPEAT | MOD_CONTROL, 0x7C)
+
+
+def test_unknown_key_is_rejected():
+    """Keys with no VK mapping return (0, 0) instead of a bad registration."""
+    assert parse_hotkey("Ctrl+0x1234567") == (0, 0)
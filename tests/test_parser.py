@@ -1,8 +1,11 @@
 """Tests for WoW Chat Log parser."""
 
+import time
+from unittest.mock import patch
+
 import pytest
 
-from app.parser import Channel, parse_addon_line, parse_line
+from app.parser import Channel, parse_addon_line, parse_line, parse_lines
 
 
 class TestParseChannelMessages:
@@ -99,17 +102,39 @@ class TestParseEdgeCases:
         msg = parse_line(line)
         assert msg is None
 
+    def test_unknown_channel_with_say_verb_returns_none(self):
+        line = '2/15 21:30:45.123  [2. Trade] Spammer-Server: he says: cheap boost'
+        assert parse_line(line) is None
+
+    def test_unknown_hchannel_returns_none(self):
+        line = '2/15 21:30:45.123  |Hchannel:CHANNEL|h[1. Общий]|h Артас-Азурегос: привет'
+        assert parse_line(line) is None
+
     def test_empty_line_returns_none(self):
         assert parse_line("") is None
 
     def test_garbage_returns_none(self):
         assert parse_line("this is not a valid log line") is None
 
+    def test_color_wrapped_timestamp_still_parses(self):
+        line = "|cff00ff002/15 21:30:45.123|r  [Party] Player-Server: hello"
+        msg = parse_line(line)
+        assert msg is not None
+        assert msg.timestamp == "2/15 21:30:45.123"
+
     def test_system_message_filtered(self):
         line = '2/15 21:30:45.123  [Guild] Player-Server: has come online'
         msg = parse_line(line)
         assert msg is None
 
+    def test_system_message_filtered_case_insensitive(self):
+        line = '2/15 21:30:45.123  [Guild] Player-Server: Someone HAS JOINED the group'
+        assert parse_line(line) is None
+
+    def test_russian_system_message_filtered(self):
+        line = '2/15 21:30:45.123  [Группа] Артас-Азурегос: Тралл заслужил достижение'
+        assert parse_line(line) is None
+
     def test_loot_message_filtered(self):
         line = '2/15 21:30:45.123  [Say] Player-Server: LOOT: something'
         msg = parse_line(line)
@@ -238,6 +263,57 @@ class TestParserRobustness:
         assert msg is None
 
 
+class TestParseNpcSayYell:
+    """NPC-style 'Name says: text' lines (no channel prefix or player link)."""
+
+    def test_npc_name_with_spaces(self):
+        msg = parse_line("2/15 21:30:45.123  High King Anduin says: For the Alliance!")
+        assert msg is not None
+        assert msg.channel == Channel.SAY
+        assert msg.author == "High King Anduin"
+        assert msg.server == ""
+        assert msg.text == "For the Alliance!"
+
+    def test_first_verb_ends_the_name(self):
+        msg = parse_line("2/15 21:30:45.123  Варок кричит: Тралл говорит: вперед")
+        assert msg is not None
+        assert msg.channel == Channel.YELL
+        assert msg.author == "Варок"
+        assert msg.text == "Тралл говорит: вперед"
+
+    def test_verb_without_space_after_colon_is_ignored(self):
+        assert parse_line("2/15 21:30:45.123  Someone says:nothing") is None
+
+
+class TestParseLineCache:
+    """Re-read lines are served from the parse cache."""
+
+    def test_repeated_line_returns_cached_message(self):
+        line = "2/15 21:30:45.123  [Guild] Cache-Server: same line twice"
+        hits = parse_line.cache_info().hits
+        first = parse_line(line)
+        assert parse_line(line) is first
+        assert parse_line.cache_info().hits == hits + 1
+
+
+class TestParseLines:
+    """Tests for batch parsing."""
+
+    def test_skips_unparseable_lines(self):
+        lines = [
+            "2/15 21:30:45.123  [Party] Thrall-Sargeras: Pull in 5",
+            "garbage",
+            "2/15 21:30:46.000  [Trade] Spammer-Server: WTS boost",
+            "2/15 21:30:47.000  To [Артас-Азурегос]: привет",
+        ]
+        msgs = parse_lines(lines)
+        assert [m.channel for m in msgs] == [Channel.PARTY, Channel.WHISPER_TO]
+        assert msgs == [parse_line(lines[0]), parse_line(lines[3])]
+
+    def test_empty_batch(self):
+        assert parse_lines([]) == []
+
+
 class TestParseAddonLine:
     """Tests for parse_addon_line (v2.1 and legacy formats)."""
 
@@ -267,3 +343,30 @@ class TestParseAddonLine:
         line = "1|RAW"
         msg, seq = parse_addon_line(line)
         assert msg is None
+
+    def test_legacy_format(self):
+        line = "7|PARTY|Thrall-Sargeras|Pull in 5"
+        msg, seq = parse_addon_line(line)
+        assert seq == 7
+        assert msg is not None
+        assert msg.channel == Channel.PARTY
+        assert msg.server == "Sargeras"
+        assert msg.text == "Pull in 5"
+
+    def test_v21_text_keeps_pipes(self):
+        line = "8|RAW|SAY|Player|score 5|10"
+        msg, _seq = parse_addon_line(line)
+        assert msg is not None
+        assert msg.text == "score 5|10"
+
+    def test_timestamp_formatted_once_per_second(self):
+        fixed = time.struct_time((2026, 2, 15, 21, 30, 5, 0, 46, 0))
+        with (
+            patch("app.parser.time.time", return_value=1_000_000.5),
+            patch("app.parser.time.localtime", return_value=fixed) as localtime,
+        ):
+            first, _ = parse_addon_line("1|RAW|SAY|Player|hello")
+            second, _ = parse_addon_line("2|RAW|SAY|Player|again")
+        assert first is not None and second is not None
+        assert first.timestamp == second.timestamp == "2/15 21:30:05.000"
+        localtime.assert_called_once_with(1_000_000)
@@ -1,6 +1,13 @@
 """Tests for built-in phrase dictionary."""
 
-from app.phrasebook import _normalize, lookup, lookup_abbreviation, stats
+from app.phrasebook import (
+    _BY_TARGET,
+    PhrasebookSession,
+    _normalize,
+    lookup,
+    lookup_abbreviation,
+    stats,
+)
 
 
 class TestNormalize:
@@ -59,6 +66,18 @@ class TestLookup:
     def test_miss_returns_none(self):
         assert lookup("supercalifragilistic", "EN", "RU") is None
 
+    def test_same_spelling_pair_hits(self):
+        """Identical words across languages still hit, so DeepL is skipped."""
+        assert lookup("hey", "EN", "DE") == "hey"
+        assert lookup("cya", "DE", "EN") == "cya"
+
+    def test_long_text_misses(self):
+        assert lookup("anyone want to run mythic plus tonight, need tank", "EN", "RU") is None
+
+    def test_longest_key_still_hits(self):
+        norm, src = max(_BY_TARGET["RU"], key=lambda key: len(key[0]))
+        assert lookup(norm, src, "RU") is not None
+
     def test_wrong_lang_pair_returns_none(self):
         assert lookup("hello", "JA", "RU") is None
 
@@ -124,12 +143,40 @@ class TestAbbreviations:
         assert lookup("gg", "EN", "RU") == "хорошая игра"
         assert lookup("brb", "DE", "RU") == "скоро вернусь"
 
+    def test_abbreviation_any_source_lang(self):
+        assert lookup("gg", "JA", "RU") == lookup_abbreviation("gg", "RU")
+        assert lookup("gg", "", "RU") == lookup_abbreviation("gg", "RU")
+
     def test_abbreviation_to_different_languages(self):
         assert lookup_abbreviation("ty", "DE") == "danke"
         assert lookup_abbreviation("ty", "FR") == "merci"
         assert lookup_abbreviation("ty", "ES") == "gracias"
 
 
+class TestPhrasebookSession:
+    """Test fixed-target lookups."""
+
+    def test_matches_module_lookups(self):
+        session = PhrasebookSession("ru")
+        for text in ("Hello!", "gg", "спасибо", "supercalifragilistic"):
+            for src in ("EN", "ru", "DE", ""):
+                assert session.lookup(text, src) == lookup(text, src, "ru")
+            assert session.lookup_abbreviation(text) == lookup_abbreviation(text, "ru")
+
+    def test_lookup_phrase_matches_lookup_after_abbreviation_miss(self):
+        session = PhrasebookSession("RU")
+        for text in ("Hello!", "gg", "спасибо", "thanks", "supercalifragilistic", ""):
+            for src in ("EN", "ru", "DE", ""):
+                if session.lookup_abbreviation(text) is None:
+                    assert session.lookup_phrase(text, src) == session.lookup(text, src)
+        assert session.lookup_phrase("hello", "en") == lookup("hello", "EN", "RU")
+
+    def test_unknown_target_misses(self):
+        session = PhrasebookSession("JA")
+        assert session.lookup("hello", "EN") is None
+        assert session.lookup_abbreviation("gg") is None
+
+
 class TestStats:
     """Test phrasebook statistics."""
 
@@ -142,3 +189,8 @@ class TestStats:
     def test_multiple_languages(self):
         s = stats()
         assert s["languages"] >= 5
+
+    def test_returns_copy(self):
+        s = stats()
+        s["entries"] = -1
+        assert stats()["entries"] > 0
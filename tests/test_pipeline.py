@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from lingua import Language
 
-from app.parser import Channel
+from app.parser import Channel, parse_line
 from app.pipeline import PipelineConfig, TranslatedMessage, TranslationPipeline
 from app.translator import TranslationResult
 
@@ -89,6 +90,18 @@ class TestPipelinePhrasebook:
         assert received[0].translation is not None
         mock_translator.translate.assert_not_called()
 
+    def test_target_change_applies_to_phrasebook(self, pipeline_config, mock_translator):
+        received: list[TranslatedMessage] = []
+
+        with patch("app.pipeline.TranslatorService", return_value=mock_translator):
+            pipeline = TranslationPipeline(pipeline_config, received.append)
+            pipeline.update_config(replace(pipeline_config, target_lang="DE"))
+            pipeline._on_new_line(_make_log_line("Raid", "Player-Server", "ty"))
+
+        assert len(received) == 1
+        assert received[0].translation is not None
+        assert received[0].translation.translated == "danke"
+
 
 class TestPipelineDeepL:
     """Test DeepL translation path."""
@@ -112,6 +125,32 @@ class TestPipelineDeepL:
         mock_translator.translate.assert_called_once()
 
 
+class TestTranslatedMessage:
+    """Test the precomputed has_useful_translation flag."""
+
+    def test_useful_translation(self):
+        msg = parse_line(_make_log_line("Party", "Thrall-Sargeras", "hello"))
+        result = TranslationResult(
+            original="hello", translated="привет",
+            source_lang="EN", target_lang="RU", success=True,
+        )
+        assert TranslatedMessage(original=msg, translation=result).has_useful_translation is True
+
+    def test_no_or_identical_translation(self):
+        msg = parse_line(_make_log_line("Party", "Thrall-Sargeras", "hello"))
+        same = TranslationResult(
+            original="hello", translated="hello",
+            source_lang="EN", target_lang="RU", success=True,
+        )
+        failed = TranslationResult(
+            original="hello", translated="",
+            source_lang="EN", target_lang="RU", success=False,
+        )
+        assert TranslatedMessage(original=msg, translation=None).has_useful_translation is False
+        assert TranslatedMessage(original=msg, translation=same).has_useful_translation is False
+        assert TranslatedMessage(original=msg, translation=failed).has_useful_translation is False
+
+
 class TestPipelineCacheHit:
     """Test that second identical message uses cache."""
 